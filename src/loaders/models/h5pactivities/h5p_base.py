@@ -1,7 +1,10 @@
 """Base classes and registry for H5P content type handlers."""
+import functools
+import importlib
 import logging
+import re
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Type
+from typing import ClassVar, Optional, Dict, Type, Union
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +12,12 @@ logger = logging.getLogger(__name__)
 class H5PContentBase(ABC):
     """Abstract base class for all H5P content types."""
     
+    # No instance attributes here, so subclasses declared with slots=True stay __dict__-free
+    __slots__ = ()
+    
+    # Accordions are skipped when InteractiveVideo renders its interactions
+    is_accordion: ClassVar[bool] = False
+    
     @classmethod
     @abstractmethod
     def from_h5p_params(cls, library: str, params: dict):
@@ -32,11 +41,12 @@ class H5PContentBase(ABC):
 
 class H5PLeaf(H5PContentBase):
     """Base class for leaf content types (cannot contain other H5P content)."""
-    pass
+    __slots__ = ()
 
 
 class H5PContainer(H5PContentBase):
     """Base class for container content types (can contain other H5P content)."""
+    __slots__ = ()
     
     @classmethod
     def extract_child_content(cls, library: str, params: dict) -> Optional[H5PContentBase]:
@@ -48,18 +58,72 @@ class H5PContainer(H5PContentBase):
         if handler_class:
             return handler_class.from_h5p_params(library, params)
         else:
-            logger.debug(f"⚠️  H5P-Typ nicht unterstützt: {library}")
+            logger.debug("⚠️  H5P-Typ nicht unterstützt: %s", library)
             return None
 
 
+def interactive_video_payload(interactions, video_url: str = "", vimeo_id: Optional[str] = None) -> dict:
+    """
+    Build the dict stored in module.interactive_video.
+    Content types without a video of their own leave video_url and vimeo_id empty.
+    """
+    return {"video_url": video_url, "vimeo_id": vimeo_id, "interactions": interactions}
+
+
 # Global registry: Maps H5P library name patterns to handler classes
-H5P_TYPE_REGISTRY: Dict[str, Type[H5PContentBase]] = {}
+H5P_TYPE_REGISTRY: Dict[str, Union[Type[H5PContentBase], str]] = {}
 _registry_initialized = False
 
-
-def register_h5p_type(library_pattern: str, handler_class: Type[H5PContentBase]) -> None:
-    """Register an H5P type handler in the global registry."""
+# Resolved handler (or None) per full library string, e.g. "H5P.MultiChoice 1.16"
+_HANDLER_CACHE: Dict[str, Optional[Type[H5PContentBase]]] = {}
+
+# Machine name at the start of a library string, e.g. "H5P.MultiChoice" in "H5P.MultiChoice 1.16"
+_LIBRARY_NAME_RE = re.compile(r"H5P\.[A-Za-z]+")
+
+
+_H5P_PACKAGE = "src.loaders.models.h5pactivities"
+
+# Built-in handlers as dotted paths, imported on first lookup (see _load_handler)
+_BUILTIN_HANDLERS: Dict[str, str] = {
+    # Leaf types
+    "H5P.Text": f"{_H5P_PACKAGE}.h5p_basics.Text",
+    "H5P.AdvancedText": f"{_H5P_PACKAGE}.h5p_basics.Text",
+    "H5P.Video": f"{_H5P_PACKAGE}.h5p_basics.H5PVideo",
+    "H5P.MultiChoice": f"{_H5P_PACKAGE}.h5p_quiz_questions.QuizQuestion",
+    "H5P.SingleChoiceSet": f"{_H5P_PACKAGE}.h5p_quiz_questions.QuizQuestion",
+    "H5P.TrueFalse": f"{_H5P_PACKAGE}.h5p_quiz_questions.TrueFalseQuestion",
+    "H5P.Blanks": f"{_H5P_PACKAGE}.h5p_blanks.FillInBlanksQuestion",
+    "H5P.DragQuestion": f"{_H5P_PACKAGE}.h5p_drag_drop.DragDropQuestion",
+    "H5P.DragText": f"{_H5P_PACKAGE}.h5p_drag_drop.DragDropText",
+    "H5P.ImageHotspot": f"{_H5P_PACKAGE}.h5p_drag_drop.ImageHotspotQuestion",
+    "H5P.Dialogcards": f"{_H5P_PACKAGE}.h5p_dialogcards.H5PDialogcards",
+    "H5P.Flashcards": f"{_H5P_PACKAGE}.h5p_flashcards.H5PFlashcards",
+    "H5P.Timeline": f"{_H5P_PACKAGE}.h5p_timeline.H5PTimeline",
+    "H5P.Summary": f"{_H5P_PACKAGE}.h5p_summary.Summary",
+    "H5P.Crossword": f"{_H5P_PACKAGE}.h5p_crossword.Crossword",
+    # Container types
+    "H5P.QuestionSet": f"{_H5P_PACKAGE}.h5p_question_set.QuestionSet",
+    "H5P.InteractiveVideo": f"{_H5P_PACKAGE}.h5p_interactive_video.InteractiveVideo",
+    "H5P.Column": f"{_H5P_PACKAGE}.h5p_wrappers.Column",
+    "H5P.Accordion": f"{_H5P_PACKAGE}.h5p_wrappers.Accordion",
+    "H5P.Gamemap": f"{_H5P_PACKAGE}.h5p_wrappers.Gamemap",
+    "H5P.GameMap": f"{_H5P_PACKAGE}.h5p_wrappers.Gamemap",  # Alternative spelling
+    "H5P.CoursePresentation": f"{_H5P_PACKAGE}.h5p_wrappers.CoursePresentation",
+    "H5P.InteractiveBook": f"{_H5P_PACKAGE}.h5p_interactive_book.InteractiveBook",
+}
+
+
+@functools.cache
+def _load_handler(handler_path: str) -> Type[H5PContentBase]:
+    """Import the module behind a dotted handler path and return the handler class."""
+    module_path, _, class_name = handler_path.rpartition(".")
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def register_h5p_type(library_pattern: str, handler_class: Union[Type[H5PContentBase], str]) -> None:
+    """Register an H5P type handler (class or dotted path to it) in the global registry."""
     H5P_TYPE_REGISTRY[library_pattern] = handler_class
+    _HANDLER_CACHE.clear()
 
 
 def _ensure_registry_initialized():
@@ -70,57 +134,54 @@ def _ensure_registry_initialized():
         initialize_registry()
 
 
+def get_library_name(library: str) -> str:
+    """Return the H5P machine name without version suffix, or "" if there is none."""
+    match = _LIBRARY_NAME_RE.match(library)
+    return match.group(0) if match else ""
+
+
 def get_handler_for_library(library: str) -> Optional[Type[H5PContentBase]]:
     """
-    Find handler for library string using substring matching.
-    Returns first matching handler or None.
+    Find handler for library string.
+    
+    Library strings look like "H5P.MultiChoice 1.16", so the machine name in
+    front of the version is tried as an exact registry key first. Only if that
+    misses, fall back to substring matching and return the first match or None.
+    Results are memoized per library string until the registry changes.
     """
+    try:
+        return _HANDLER_CACHE[library]
+    except KeyError:
+        pass
     _ensure_registry_initialized()
-    for pattern, handler_class in H5P_TYPE_REGISTRY.items():
-        if pattern in library:
-            return handler_class
-    return None
+    handler_class = _HANDLER_CACHE[library] = _resolve_handler(library)
+    return handler_class
+
+
+def _resolve_handler(library: str) -> Optional[Type[H5PContentBase]]:
+    """Uncached registry lookup behind get_handler_for_library."""
+    handler_class = H5P_TYPE_REGISTRY.get(get_library_name(library))
+    if handler_class is None:
+        for pattern, candidate in H5P_TYPE_REGISTRY.items():
+            if pattern in library:
+                handler_class = candidate
+                break
+        else:
+            return None
+    if isinstance(handler_class, str):
+        return _load_handler(handler_class)
+    return handler_class
 
 
 def initialize_registry():
-    """Populate the H5P type registry with all known handlers."""
-    from src.loaders.models.h5pactivities.h5p_basics import Text, H5PVideo
-    from src.loaders.models.h5pactivities.h5p_quiz_questions import QuizQuestion, TrueFalseQuestion
-    from src.loaders.models.h5pactivities.h5p_blanks import FillInBlanksQuestion
-    from src.loaders.models.h5pactivities.h5p_drag_drop import DragDropQuestion, DragDropText, ImageHotspotQuestion
-    from src.loaders.models.h5pactivities.h5p_dialogcards import H5PDialogcards
-    from src.loaders.models.h5pactivities.h5p_flashcards import H5PFlashcards
-    from src.loaders.models.h5pactivities.h5p_timeline import H5PTimeline
-    from src.loaders.models.h5pactivities.h5p_summary import Summary
-    from src.loaders.models.h5pactivities.h5p_question_set import QuestionSet
-    from src.loaders.models.h5pactivities.h5p_interactive_video import InteractiveVideo
-    from src.loaders.models.h5pactivities.h5p_interactive_book import InteractiveBook
-    from src.loaders.models.h5pactivities.h5p_wrappers import Column, Accordion, Gamemap, CoursePresentation
-    from src.loaders.models.h5pactivities.h5p_crossword import Crossword
+    """
+    Populate the H5P type registry with all known handlers.
     
-    # Register leaf types
-    register_h5p_type("H5P.Text", Text)
-    register_h5p_type("H5P.AdvancedText", Text)
-    register_h5p_type("H5P.Video", H5PVideo)
-    register_h5p_type("H5P.MultiChoice", QuizQuestion)
-    register_h5p_type("H5P.SingleChoiceSet", QuizQuestion)
-    register_h5p_type("H5P.TrueFalse", TrueFalseQuestion)
-    register_h5p_type("H5P.Blanks", FillInBlanksQuestion)
-    register_h5p_type("H5P.DragQuestion", DragDropQuestion)
-    register_h5p_type("H5P.DragText", DragDropText)
-    register_h5p_type("H5P.ImageHotspot", ImageHotspotQuestion)
-    register_h5p_type("H5P.Dialogcards", H5PDialogcards)
-    register_h5p_type("H5P.Flashcards", H5PFlashcards)
-    register_h5p_type("H5P.Timeline", H5PTimeline)
-    register_h5p_type("H5P.Summary", Summary)
-    register_h5p_type("H5P.Crossword", Crossword)
+    Handlers are registered by dotted path; a handler module is only imported
+    when its type is looked up for the first time.
+    """
+    global _registry_initialized
+    _registry_initialized = True
     
-    # Register container types
-    register_h5p_type("H5P.QuestionSet", QuestionSet)
-    register_h5p_type("H5P.InteractiveVideo", InteractiveVideo)
-    register_h5p_type("H5P.Column", Column)
-    register_h5p_type("H5P.Accordion", Accordion)
-    register_h5p_type("H5P.Gamemap", Gamemap)
-    register_h5p_type("H5P.GameMap", Gamemap)  # Alternative spelling
-    register_h5p_type("H5P.CoursePresentation", CoursePresentation)
-    register_h5p_type("H5P.InteractiveBook", InteractiveBook)
+    for library_pattern, handler_path in _BUILTIN_HANDLERS.items():
+        register_h5p_type(library_pattern, handler_path)
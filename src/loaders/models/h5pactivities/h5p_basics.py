@@ -1,8 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 import zipfile
-from src.loaders.models.hp5activities import strip_html, extract_library_from_h5p
-from src.loaders.models.h5pactivities.h5p_base import H5PLeaf
+from src.loaders.models.hp5activities import strip_html, extract_library_from_h5p, read_h5p_file
+from src.loaders.models.h5pactivities.h5p_base import H5PLeaf, interactive_video_payload
 
 
 @dataclass
@@ -10,6 +10,8 @@ class Text(H5PLeaf):
     """Text-Einblendung im Interactive Video."""
     type: str  # z.B. "H5P.Text" oder "H5P.AdvancedText"
     text: str
+    # Gecachte Ausgabe von to_text() (Instanzen werden nach dem Parsen nicht verändert)
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -24,11 +26,7 @@ class Text(H5PLeaf):
         
         if text:
             # Speichere als dict (Dependency Inversion)
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [text.to_text()]
-            }
+            module.interactive_video = interactive_video_payload([text.to_text()])
             return None
         
         return "Konnte Text nicht extrahieren"
@@ -45,8 +43,9 @@ class Text(H5PLeaf):
         return None
     
     def to_text(self) -> str:
-        text_clean = strip_html(self.text)
-        return f"[Info] {text_clean}"
+        if self._cached_text is None:
+            self._cached_text = f"[Info] {strip_html(self.text)}"
+        return self._cached_text
 
 
 @dataclass
@@ -81,12 +80,10 @@ class H5PVideo(H5PLeaf):
         err_message = None
 
         # Versuche Vimeo-/YouTube-Parsing wie bei InteractiveVideo
-        try:
-            if video_service and video_obj.video_url:
-                video = video_service(id=0, vimeo_url=video_obj.video_url)
+        if video_service and video_obj.video_url:
+            video = video_service.try_from_url(video_obj.video_url)
+            if video is not None:
                 vimeo_id = video.video_id
-        except Exception:
-            pass
 
         # === TRANSKRIPT EXTRAHIEREN ===
         # Versuche VTT-Datei aus H5P-Package zu extrahieren (Fallback)
@@ -106,9 +103,9 @@ class H5PVideo(H5PLeaf):
                 
                 if vtt_path:
                     fallback_transcript_file = f"content/{vtt_path}"
-                    with zipfile.ZipFile(h5p_zip_path, "r") as zip_ref:
-                        with zip_ref.open(fallback_transcript_file) as vtt_file:
-                            fallback_transcript_content = vtt_file.read().decode('utf-8')
+                    vtt_bytes = read_h5p_file(h5p_zip_path, fallback_transcript_file, kwargs.get("h5p_zip"))
+                    if vtt_bytes is not None:
+                        fallback_transcript_content = vtt_bytes.decode('utf-8')
             except (KeyError, IndexError, FileNotFoundError, zipfile.BadZipFile):
                 # Kein VTT-File im H5P-Package gefunden
                 fallback_transcript_content = None
@@ -125,11 +122,7 @@ class H5PVideo(H5PLeaf):
             video_obj.vimeo_id = vimeo_id
 
         # Speichere als dict (Dependency Inversion)
-        module.interactive_video = {
-            "video_url": video_obj.video_url,
-            "vimeo_id": vimeo_id,
-            "interactions": [video_obj.to_text()],
-        }
+        module.interactive_video = interactive_video_payload([video_obj.to_text()], video_obj.video_url, vimeo_id)
 
         return err_message
 
@@ -1,7 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from src.loaders.models.hp5activities import strip_html, extract_library_from_h5p
-from src.loaders.models.h5pactivities.h5p_base import H5PLeaf
+from src.loaders.models.h5pactivities.h5p_base import H5PLeaf, interactive_video_payload
 
 
 @dataclass
@@ -11,6 +11,8 @@ class FillInBlanksQuestion(H5PLeaf):
     question: str
     text_with_blanks: str
     blank_indicator: str = "**"
+    # Gecachte Ausgabe von to_text() (Instanzen werden nach dem Parsen nicht verändert)
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -25,11 +27,7 @@ class FillInBlanksQuestion(H5PLeaf):
         
         if blanks:
             # Speichere als dict (Dependency Inversion)
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [blanks.to_text()]
-            }
+            module.interactive_video = interactive_video_payload([blanks.to_text()])
             return None
         
         return "Konnte Lückentext nicht extrahieren"
@@ -55,6 +53,8 @@ class FillInBlanksQuestion(H5PLeaf):
         return None
     
     def to_text(self) -> str:
-        question_clean = strip_html(self.question)
-        text_clean = strip_html(self.text_with_blanks)
-        return f"[Lückentext] {question_clean}\n{text_clean}"
\ No newline at end of file
+        if self._cached_text is None:
+            question_clean = strip_html(self.question)
+            text_clean = strip_html(self.text_with_blanks)
+            self._cached_text = f"[Lückentext] {question_clean}\n{text_clean}"
+        return self._cached_text
\ No newline at end of file
@@ -2,7 +2,7 @@
 from dataclasses import dataclass, field
 from typing import Optional
 from src.loaders.models.hp5activities import strip_html, extract_library_from_h5p
-from src.loaders.models.h5pactivities.h5p_base import H5PLeaf
+from src.loaders.models.h5pactivities.h5p_base import H5PLeaf, interactive_video_payload
 
 
 @dataclass
@@ -14,7 +14,7 @@ class CrosswordEntry:
     
     def to_text(self) -> str:
         """Formatiert als: <clue>. Antwort: <answer>"""
-        clue_clean = strip_html(self.clue).strip()
+        clue_clean = strip_html(self.clue)
         return f"Frage: {clue_clean}. Antwort: {self.answer}"
 
 
@@ -46,11 +46,7 @@ class Crossword(H5PLeaf):
         
         if crossword and crossword.entries:
             # Speichere als dict (Dependency Inversion)
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [crossword.to_text()]
-            }
+            module.interactive_video = interactive_video_payload([crossword.to_text()])
             return None
         
         return "Konnte Kreuzworträtsel nicht extrahieren oder keine Einträge gefunden"
@@ -107,7 +103,7 @@ class Crossword(H5PLeaf):
         
         # Task-Description hinzufügen (falls vorhanden)
         if self.task_description:
-            task_clean = strip_html(self.task_description).strip()
+            task_clean = strip_html(self.task_description)
             if task_clean:
                 parts.append(task_clean)
         
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from src.loaders.models.hp5activities import strip_html, extract_library_from_h5p
-from src.loaders.models.h5pactivities.h5p_base import H5PLeaf
+from src.loaders.models.h5pactivities.h5p_base import H5PLeaf, interactive_video_payload
 
 
 @dataclass
@@ -13,8 +13,8 @@ class DialogCard:
 
     def to_text(self) -> str:
         """Formatiert die Karte als 'text: answer'."""
-        clean_text = strip_html(self.text).strip()
-        clean_answer = strip_html(self.answer).strip()
+        clean_text = strip_html(self.text)
+        clean_answer = strip_html(self.answer)
         return f"{clean_text}: {clean_answer}"
 
 
@@ -37,11 +37,7 @@ class H5PDialogcards(H5PLeaf):
 
         if dialogcards:
             # Speichere als dict (Dependency Inversion)
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [dialogcards.to_text()],
-            }
+            module.interactive_video = interactive_video_payload([dialogcards.to_text()])
             return None
 
         return "Konnte H5P.Dialogcards nicht extrahieren"
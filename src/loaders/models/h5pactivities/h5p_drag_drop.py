@@ -1,7 +1,16 @@
 from dataclasses import dataclass, field
 from typing import Optional
 from src.loaders.models.hp5activities import strip_html, extract_library_from_h5p
-from src.loaders.models.h5pactivities.h5p_base import H5PLeaf
+from src.loaders.models.h5pactivities.h5p_base import H5PLeaf, interactive_video_payload
+
+# Gemeinsamer, nie veränderter Default für .get()-Ketten (spart eine dict-Allokation pro Aufruf)
+_EMPTY: dict = {}
+
+
+def _get_drag_task(params: dict) -> tuple[list, list]:
+    """Liefert (dropZones, elements) aus params.question.task (H5P.DragQuestion / ImageHotspot)."""
+    task = params.get("question", _EMPTY).get("task", _EMPTY)
+    return task.get("dropZones", []), task.get("elements", [])
 
 
 @dataclass
@@ -11,6 +20,8 @@ class DragDropText(H5PLeaf):
     task_description: str
     text_field: str  # Text mit *Wort*-Markierungen für Lücken
     hint: str = "Wörter in Asterisken (*...*) müssen in die richtige Lücke gezogen werden."
+    # Gecachte Ausgabe von to_text() (Instanzen werden nach dem Parsen nicht verändert)
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -25,11 +36,7 @@ class DragDropText(H5PLeaf):
         
         if drag_text:
             # Speichere als dict (Dependency Inversion)
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [drag_text.to_text()]
-            }
+            module.interactive_video = interactive_video_payload([drag_text.to_text()])
             return None
         
         return "Konnte Drag-Text-Aufgabe nicht extrahieren"
@@ -54,9 +61,11 @@ class DragDropText(H5PLeaf):
         return None
     
     def to_text(self) -> str:
-        task_clean = strip_html(self.task_description)
-        text_clean = strip_html(self.text_field)
-        return f"[Drag Text] {task_clean}\n{self.hint}\n{text_clean}"
+        if self._cached_text is None:
+            task_clean = strip_html(self.task_description)
+            text_clean = strip_html(self.text_field)
+            self._cached_text = f"[Drag Text] {task_clean}\n{self.hint}\n{text_clean}"
+        return self._cached_text
 
 
 @dataclass
@@ -67,6 +76,8 @@ class DragDropQuestion(H5PLeaf):
     categories: list[str]  # Dropzones/Kategorien
     draggable_items: list[str]  # Elemente zum Ziehen
     correct_mappings: dict[str, list[str]] = field(default_factory=dict)  # Kategorie -> Liste von Elementen
+    # Gecachte Ausgabe von to_text() (Instanzen werden nach dem Parsen nicht verändert)
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -81,11 +92,7 @@ class DragDropQuestion(H5PLeaf):
         
         if drag_drop:
             # Speichere als dict (Dependency Inversion)
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [drag_drop.to_text()]
-            }
+            module.interactive_video = interactive_video_payload([drag_drop.to_text()])
             return None
         
         return "Konnte Drag&Drop-Aufgabe nicht extrahieren"
@@ -93,9 +100,7 @@ class DragDropQuestion(H5PLeaf):
     @classmethod
     def from_h5p_params(cls, library: str, params: dict) -> Optional['DragDropQuestion']:
         """Extrahiert DragDropQuestion aus H5P params."""
-        task = params.get("question", {}).get("task", {})
-        dropzones = task.get("dropZones", [])
-        elements = task.get("elements", [])
+        dropzones, elements = _get_drag_task(params)
         
         question_text = "Ordne die Elemente den Kategorien zu:"
         
@@ -104,7 +109,7 @@ class DragDropQuestion(H5PLeaf):
         category_map = {}  # Index -> Label
         for idx, dz in enumerate(dropzones):
             label_html = dz.get("label", "").strip()
-            label_clean = strip_html(label_html).strip()
+            label_clean = strip_html(label_html)
             if label_clean:
                 categories.append(label_html)  # Original für to_text() wo nochmal gestrippt wird
                 category_map[str(idx)] = label_clean
@@ -113,8 +118,8 @@ class DragDropQuestion(H5PLeaf):
         draggable_items = []
         element_map = {}  # Index -> Text (bereits cleaned)
         for idx, elem in enumerate(elements):
-            text_html = elem.get("type", {}).get("params", {}).get("text", "").strip()
-            text_clean = strip_html(text_html).strip()
+            text_html = elem.get("type", _EMPTY).get("params", _EMPTY).get("text", "").strip()
+            text_clean = strip_html(text_html)
             if text_clean:
                 draggable_items.append(text_html)  # Original für to_text()
                 element_map[str(idx)] = text_clean
@@ -147,23 +152,28 @@ class DragDropQuestion(H5PLeaf):
         return None
     
     def to_text(self) -> str:
-        question_clean = strip_html(self.question)
-        categories_clean = [strip_html(c) for c in self.categories]
-        items_clean = [strip_html(i) for i in self.draggable_items]
+        if self._cached_text is not None:
+            return self._cached_text
+        _strip = strip_html
+        question_clean = _strip(self.question)
+        categories_clean = map(_strip, self.categories)
+        items_clean = map(_strip, self.draggable_items)
         
-        result = (
-            f"[Drag & Drop] {question_clean}\n"
-            f"Kategorien: {', '.join(categories_clean)}\n"
-            f"Elemente: {', '.join(items_clean)}\n\n"
-            f"Korrekte Zuordnung:\n"
+        parts = [
+            f"[Drag & Drop] {question_clean}",
+            f"Kategorien: {', '.join(categories_clean)}",
+            f"Elemente: {', '.join(items_clean)}",
+            "",
+            "Korrekte Zuordnung:",
+        ]
+        # Ein join am Ende statt wiederholtem += (jedes += kopiert den bisherigen String)
+        parts.extend(
+            f"  {_strip(category)}: {', '.join(map(_strip, items))}"
+            for category, items in self.correct_mappings.items()
         )
-        
-        for category, items in self.correct_mappings.items():
-            category_clean = strip_html(category)
-            items_clean_list = [strip_html(item) for item in items]
-            result += f"  {category_clean}: {', '.join(items_clean_list)}\n"
-        
-        return result
+        parts.append("")
+        self._cached_text = "\n".join(parts)
+        return self._cached_text
     
 @dataclass
 class ImageHotspotQuestion(H5PLeaf):
@@ -187,11 +197,7 @@ class ImageHotspotQuestion(H5PLeaf):
         
         if question and question.mappings:
             # Speichere als dict (Dependency Inversion)
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [question.to_text()]
-            }
+            module.interactive_video = interactive_video_payload([question.to_text()])
             return None
         
         return "Konnte Image Hotspot Question nicht extrahieren"
@@ -204,11 +210,7 @@ class ImageHotspotQuestion(H5PLeaf):
         Verarbeitet Struktur: params.question.task.elements[] und params.question.task.dropZones[]
         """
         try:
-            question_data = params.get("question", {})
-            task = question_data.get("task", {})
-            
-            elements = task.get("elements", [])
-            drop_zones = task.get("dropZones", [])
+            drop_zones, elements = _get_drag_task(params)
             
             if not elements or not drop_zones:
                 return None
@@ -218,16 +220,16 @@ class ImageHotspotQuestion(H5PLeaf):
             for zone_idx, zone in enumerate(drop_zones):
                 label_html = zone.get("label", f"Zone {zone_idx}")
                 # Entferne HTML-Tags aus Label
-                label_clean = strip_html(label_html).strip()
+                label_clean = strip_html(label_html)
                 zone_labels[zone_idx] = label_clean
             
             mappings = []
             
             # Für jedes Element prüfe, ob es Text ist und welcher DropZone es zugeordnet ist
             for elem_idx, element in enumerate(elements):
-                element_type = element.get("type", {})
+                element_type = element.get("type", _EMPTY)
                 element_library = element_type.get("library", "")
-                element_params = element_type.get("params", {})
+                element_params = element_type.get("params", _EMPTY)
                 
                 # Ignoriere Bilder (H5P.Image)
                 if "Image" in element_library:
@@ -238,7 +240,7 @@ class ImageHotspotQuestion(H5PLeaf):
                 if "AdvancedText" in element_library or "Text" in element_library:
                     text_html = element_params.get("text", "").strip()
                     if text_html:
-                        element_text = strip_html(text_html).strip()
+                        element_text = strip_html(text_html)
                 
                 if not element_text:
                     continue
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from src.loaders.models.hp5activities import strip_html, extract_library_from_h5p
-from src.loaders.models.h5pactivities.h5p_base import H5PLeaf
+from src.loaders.models.h5pactivities.h5p_base import H5PLeaf, interactive_video_payload
 
 
 @dataclass
@@ -11,8 +11,8 @@ class Flashcard:
 	answer: str
 
 	def to_text(self) -> str:
-		text_clean = strip_html(self.text).strip()
-		answer_clean = strip_html(self.answer).strip()
+		text_clean = strip_html(self.text)
+		answer_clean = strip_html(self.answer)
 		return f"{text_clean}: {answer_clean}"
 
 
@@ -36,11 +36,7 @@ class H5PFlashcards(H5PLeaf):
 		flashcards = cls.from_h5p_params(library, params)
 
 		if flashcards and flashcards.cards:
-			module.interactive_video = {
-				"video_url": "",
-				"vimeo_id": None,
-				"interactions": [flashcards.to_text()],
-			}
+			module.interactive_video = interactive_video_payload([flashcards.to_text()])
 			return None
 
 		return "Konnte Flashcards nicht extrahieren"
@@ -3,11 +3,14 @@ import logging
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
-from src.loaders.models.hp5activities import extract_library_from_h5p, strip_html
-from src.loaders.models.h5pactivities.h5p_base import H5PContainer
+from src.loaders.models.hp5activities import extract_library_from_h5p, strip_html, strip_html_many
+from src.loaders.models.h5pactivities.h5p_base import H5PContainer, interactive_video_payload
 
 logger = logging.getLogger(__name__)
 
+# Ab dieser Kapitelanzahl werden die Titel gesammelt statt einzeln bereinigt
+_BATCH_STRIP_MIN_TITLES = 32
+
 
 @dataclass
 class BookChapter:
@@ -17,17 +20,11 @@ class BookChapter:
     
     def to_text(self) -> str:
         """Formatiert das Kapitel als Text mit Titel und allen Inhalten."""
-        lines = []
-        
-        for content in self.contents:
-            if hasattr(content, 'to_text'):
-                text_output = content.to_text()
-            else:
-                text_output = str(content)
-            if text_output and text_output.strip():
-                lines.append(text_output)
-        
-        return "\n".join(lines)
+        return "\n".join(
+            text_output
+            for text_output in (content.to_text() for content in self.contents)
+            if text_output and text_output.strip()
+        )
 
 
 @dataclass
@@ -65,11 +62,7 @@ class InteractiveBook(H5PContainer):
         if book and book.chapters:
             # Speichere als dict (Dependency Inversion)
             # Jedes Kapitel wird als separater Text gespeichert
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [book.to_text()],
-            }
+            module.interactive_video = interactive_video_payload([book.to_text()])
             return None
         
         return "Konnte Interactive Book nicht extrahieren oder keine Kapitel gefunden"
@@ -88,20 +81,22 @@ class InteractiveBook(H5PContainer):
         
         if params.get("showCoverPage"):
             book_cover = params.get("bookCover", {})
-            cover_title = strip_html(book_cover.get("coverTitle", "")).strip()
-            cover_description = strip_html(book_cover.get("coverDescription", "")).strip()
+            cover_title = strip_html(book_cover.get("coverTitle", ""))
+            cover_description = strip_html(book_cover.get("coverDescription", ""))
         
-        # Kapitel extrahieren
-        extracted_chapters = []
+        # Kapitel extrahieren (Titel werden erst danach gesammelt bereinigt)
+        raw_titles = []
+        raw_chapters = []
         
         for chapter_data in params.get("chapters", []):
             # Titel kann entweder direkt oder in metadata sein
             chapter_title = chapter_data.get("title", "")
             if not chapter_title:
                 chapter_title = chapter_data.get("metadata", {}).get("title", "")
-            chapter_title = strip_html(chapter_title).strip()
+            raw_titles.append(chapter_title)
             
             chapter_contents = []
+            raw_chapters.append(chapter_contents)
             
             # Inhalte können direkt unter "content" oder unter "params.content" liegen
             content_items = chapter_data.get("content", [])
@@ -113,8 +108,8 @@ class InteractiveBook(H5PContainer):
                 # Struktur kann sein:
                 # 1. Direkt: { "library": "...", "params": {...} }
                 # 2. Verschachtelt: { "content": { "library": "...", "params": {...} } }
-                if "content" in item and isinstance(item.get("content"), dict):
-                    content_obj = item["content"]
+                content_obj = item.get("content")
+                if type(content_obj) is dict:
                     content_library = content_obj.get("library", "")
                     content_params = content_obj.get("params", {})
                 else:
@@ -129,7 +124,15 @@ class InteractiveBook(H5PContainer):
                 
                 if extracted:
                     chapter_contents.append(extracted)
-            
+        
+        # Bei vielen Kapiteln lohnt sich ein einziger Regex-Durchlauf über alle Titel
+        if len(raw_titles) > _BATCH_STRIP_MIN_TITLES:
+            chapter_titles = strip_html_many(raw_titles)
+        else:
+            chapter_titles = [strip_html(title) for title in raw_titles]
+        
+        extracted_chapters = []
+        for chapter_title, chapter_contents in zip(chapter_titles, raw_chapters):
             # Nur Kapitel mit Inhalt hinzufügen
             if chapter_contents or chapter_title:
                 extracted_chapters.append(BookChapter(
@@ -162,17 +165,18 @@ class InteractiveBook(H5PContainer):
         
         lines.append("")
         
-        # Kapitel ausgeben
+        # Kapitel ausgeben (ein extend pro Kapitel statt einzelner appends)
+        extend = lines.extend
         for i, chapter in enumerate(self.chapters, start=1):
             if chapter.title:
-                lines.append(f"--- Kapitel {i}: {chapter.title} ---")
+                header = f"--- Kapitel {i}: {chapter.title} ---"
             else:
-                lines.append(f"--- Kapitel {i} ---")
+                header = f"--- Kapitel {i} ---"
             
             chapter_text = chapter.to_text()
             if chapter_text:
-                lines.append(chapter_text)
-            
-            lines.append("")
+                extend((header, chapter_text, ""))
+            else:
+                extend((header, ""))
         
         return "\n".join(lines)
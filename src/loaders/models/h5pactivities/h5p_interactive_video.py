@@ -1,26 +1,58 @@
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 import tempfile
 import zipfile
-import re
-from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
 
-from src.loaders.models.h5pactivities.h5p_base import H5PContainer, H5PContentBase
+from src.loaders.models.hp5activities import read_h5p_file
+from src.loaders.models.h5pactivities.h5p_base import H5PContainer, H5PContentBase, interactive_video_payload
 from src.loaders.models.h5pactivities.h5p_summary import Summary
 
+# Gemeinsamer Default für .get()-Ketten; wird nie verändert (unveränderlich per Konvention)
+_EMPTY_DICT: dict = {}
+
+# Package-lokale Pfade (z.B. "videos/clip.mp4") haben kein ":" vor dem ersten "/" und können
+# HttpUrl nie passieren; alles mit Schema-Präfix prüft pydantic, das auch fehlerhafte Links
+# wie "https:/vimeo.com/123" oder "https:vimeo.com/123" normalisiert
+_URL_SCHEME_RE = re.compile(r"^[^/]*:")
+
+
+def _get_video_url(iv: dict) -> Optional[str]:
+    """Liest interactiveVideo.video.files[0].path, None falls der Pfad nicht existiert."""
+    try:
+        return iv["video"]["files"][0]["path"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _build_dict(video_url: str, vimeo_id: Optional[str], interactions: list[H5PContentBase]) -> dict:
+    """dict-Form eines InteractiveVideo für module.interactive_video (Accordions werden ausgelassen)."""
+    return interactive_video_payload([i.to_text() for i in interactions if not i.is_accordion], video_url, vimeo_id)
 
-@dataclass
+
+def _get_interaction_list(iv: dict) -> list:
+    """Interaktionen liegen entweder unter assets.interactions oder direkt unter interactions."""
+    if "assets" in iv and "interactions" in iv["assets"]:
+        return iv["assets"]["interactions"]
+    return iv.get("interactions", [])
+
+
+@dataclass(slots=True)
 class InteractiveVideo(H5PContainer):
     """Parsed H5P Interactive Video Content."""
     video_url: str
     vimeo_id: Optional[str] = None
     interactions: list[H5PContentBase] = field(default_factory=list)
+    # Zwischengespeichertes Ergebnis von to_dict() (Interaktionen werden nach dem Parsen nicht mehr verändert)
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
-    def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, vimeo_service, video_service) -> Optional[str]:
+    def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, vimeo_service, video_service,
+                         h5p_zip: Optional[zipfile.ZipFile] = None) -> Optional[str]:
         """
         Extrahiert InteractiveVideo aus H5P Package inkl. Transkript und befüllt Module-Objekt.
         
@@ -30,6 +62,7 @@ class InteractiveVideo(H5PContainer):
             h5p_zip_path: Pfad zum H5P ZIP-File (für Fallback-Transkript)
             vimeo_service: Vimeo() Instanz für Transkript-Download
             video_service: Video Klasse für URL-Parsing
+            h5p_zip: Optional bereits geöffnetes ZipFile des Packages (vermeidet erneutes Öffnen)
             
         Returns:
             Optional[str]: Fehlermeldung oder None
@@ -39,19 +72,19 @@ class InteractiveVideo(H5PContainer):
         
         iv = content["interactiveVideo"]
         
+        # Benötigte Teilstrukturen einmal vorab auslesen, danach wird nur noch damit gearbeitet
+        video_url = _get_video_url(iv)
+        video_tracks = iv.get("video", _EMPTY_DICT).get("textTracks", _EMPTY_DICT).get("videoTrack", ())
+        interaction_list = _get_interaction_list(iv)
+        summary_data = iv.get("summary")
+        
         # Video URL extrahieren
-        try:
-            video_url = iv["video"]["files"][0]["path"]
-        except (KeyError, IndexError):
+        if video_url is None:
             return "Keine Video-URL gefunden"
         
-        # Video-Objekt erstellen (für vimeo_id)
-        video = None
-        try:
-            video = video_service(id=0, vimeo_url=video_url)
-        except (ValidationError, Exception):
-            # No link to external Video-Service
-            pass
+        # Video-Objekt erstellen (für vimeo_id), None wenn kein Link zu externem Video-Service;
+        # lokale Dateien im Package werden ohne teure Validierung übersprungen
+        video = video_service.try_from_url(video_url) if isinstance(video_url, str) and _URL_SCHEME_RE.match(video_url) else None
         
         if not video:
             return "Kein Vimeo-Video im H5P gefunden"
@@ -59,61 +92,40 @@ class InteractiveVideo(H5PContainer):
         vimeo_id = video.video_id
         
         # === TRANSKRIPT EXTRAHIEREN ===
-        texttrack = None
-        err_message = None
-        
         # Versuche VTT-Datei aus H5P-Package zu extrahieren
+        # (ohne VTT-File im H5P wird trotzdem Vimeo versucht)
         fallback_transcript_content = None
-        try:
-            fallback_transcript_file = f"content/{iv['video']['textTracks']['videoTrack'][0]['track']['path']}"
-            with zipfile.ZipFile(h5p_zip_path, "r") as zip_ref:
-                with zip_ref.open(fallback_transcript_file) as vtt_file:
-                    fallback_transcript_content = vtt_file.read().decode('utf-8')
-        except (KeyError, IndexError, FileNotFoundError):
-            # Kein VTT-File im H5P, versuche trotzdem Vimeo
-            fallback_transcript_content = None
-        
-        # Hole Transkript von Vimeo (mit oder ohne Fallback)
-        texttrack, err_message = vimeo_service.get_transcript(
-            vimeo_id, fallback_transcript_content=fallback_transcript_content
-        )
-        
-        # === INTERAKTIONEN EXTRAHIEREN ===
-        interactions = []
-        
-        # Prüfe beide mögliche Strukturen
-        interaction_list = []
-        if "assets" in iv and "interactions" in iv["assets"]:
-            interaction_list = iv["assets"]["interactions"]
-        elif "interactions" in iv:
-            interaction_list = iv["interactions"]
-        
-        for interaction in interaction_list:
-            action = interaction.get("action", {})
-            library = action.get("library", "")
-            params = action.get("params", {})
+        vtt_path = video_tracks[0].get("track", _EMPTY_DICT).get("path") if video_tracks else None
+        if vtt_path:
+            try:
+                vtt_bytes = read_h5p_file(h5p_zip_path, f"content/{vtt_path}", h5p_zip)
+            except FileNotFoundError:
+                vtt_bytes = None
+            if vtt_bytes is not None:
+                fallback_transcript_content = vtt_bytes.decode('utf-8')
+        
+        # Hole Transkript von Vimeo (mit oder ohne Fallback) im Hintergrund,
+        # damit der Netzwerk-Request parallel zum Parsen der Interaktionen läuft
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            transcript_future = executor.submit(
+                vimeo_service.get_transcript,
+                vimeo_id, fallback_transcript_content=fallback_transcript_content
+            )
             
-            # Versuche jede Klasse
-            extracted = InteractiveVideo.extract_child_content(library, params)
+            # === INTERAKTIONEN EXTRAHIEREN ===
+            interactions = [extracted for extracted in map(_extract_interaction, interaction_list) if extracted]
             
-            if extracted:
-                interactions.append(extracted)
-        
-        # === SUMMARY EXTRAHIEREN ===
-        if "summary" in iv:
-            summary = Summary.from_h5p_summary_data(iv["summary"])
-            if summary:
-                interactions.append(summary)
-        
-        # Erstelle InteractiveVideo und befülle Module
-        interactive_video = cls(
-            video_url=video_url,
-            vimeo_id=vimeo_id,
-            interactions=interactions
-        )
+            # === SUMMARY EXTRAHIEREN ===
+            if summary_data is not None:
+                summary = Summary.from_h5p_summary_data(summary_data)
+                if summary:
+                    interactions.append(summary)
+            
+            texttrack, err_message = transcript_future.result()
         
-        # Speichere als dict in module (Dependency Inversion - module kennt h5pactivities nicht)
-        module.interactive_video = interactive_video.to_dict()
+        # Speichere als dict in module (Dependency Inversion - module kennt h5pactivities nicht);
+        # eine InteractiveVideo-Instanz wird dafür nicht benötigt
+        module.interactive_video = _build_dict(video_url, vimeo_id, interactions)
         
         if texttrack:
             module.transcripts.append(texttrack)
@@ -134,26 +146,12 @@ class InteractiveVideo(H5PContainer):
         iv = params["interactiveVideo"]
         
         # Try to get video URL
-        try:
-            video_url = iv["video"]["files"][0]["path"]
-        except (KeyError, IndexError):
+        video_url = _get_video_url(iv)
+        if video_url is None:
             video_url = ""
         
         # Extract interactions if possible
-        interactions = []
-        interaction_list = []
-        if "assets" in iv and "interactions" in iv["assets"]:
-            interaction_list = iv["assets"]["interactions"]
-        elif "interactions" in iv:
-            interaction_list = iv["interactions"]
-        
-        for interaction in interaction_list:
-            action = interaction.get("action", {})
-            lib = action.get("library", "")
-            prms = action.get("params", {})
-            extracted = cls.extract_child_content(lib, prms)
-            if extracted:
-                interactions.append(extracted)
+        interactions = [extracted for extracted in map(_extract_interaction, _get_interaction_list(iv)) if extracted]
         
         return cls(
             video_url=video_url,
@@ -163,28 +161,25 @@ class InteractiveVideo(H5PContainer):
     
     def to_text(self) -> str:
         """Convert InteractiveVideo content to text representation."""
-        from src.loaders.models.h5pactivities.h5p_wrappers import Accordion
-        filtered_interactions = [i for i in self.interactions if not isinstance(i, Accordion)]
-        
         parts = []
         if self.video_url:
             parts.append(f"Video: {self.video_url}")
         if self.vimeo_id:
             parts.append(f"Vimeo ID: {self.vimeo_id}")
         
-        for interaction in filtered_interactions:
-            parts.append(interaction.to_text())
+        # Accordions filtern und rendern in einem Durchlauf
+        parts.extend(i.to_text() for i in self.interactions if not i.is_accordion)
         
         return "\n".join(parts)
     
     def to_dict(self) -> dict:
         """Konvertiert InteractiveVideo zu dict für Speicherung in Module."""
-        # Filtere Accordion-Elemente raus
-        from src.loaders.models.h5pactivities.h5p_wrappers import Accordion
-        filtered_interactions = [i for i in self.interactions if not isinstance(i, Accordion)]
-        
-        return {
-            "video_url": self.video_url,
-            "vimeo_id": self.vimeo_id,
-            "interactions": [interaction.to_text() for interaction in filtered_interactions]
-        }
\ No newline at end of file
+        if self._dict_cache is None:
+            self._dict_cache = _build_dict(self.video_url, self.vimeo_id, self.interactions)
+        return self._dict_cache
+
+
+def _extract_interaction(interaction: dict) -> Optional[H5PContentBase]:
+    """Extrahiert die action einer Interaktion über den passenden Handler."""
+    action = interaction.get("action", _EMPTY_DICT)
+    return InteractiveVideo.extract_child_content(action.get("library", ""), action.get("params", _EMPTY_DICT))
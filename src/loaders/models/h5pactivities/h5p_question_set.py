@@ -1,18 +1,22 @@
+from __future__ import annotations
+
 import logging
 from dataclasses import dataclass, field
 from typing import Optional
 from src.loaders.models.hp5activities import extract_library_from_h5p
-from src.loaders.models.h5pactivities.h5p_base import H5PContainer, H5PContentBase
+from src.loaders.models.h5pactivities.h5p_base import H5PContainer, H5PContentBase, interactive_video_payload
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionSet(H5PContainer):
     """H5P.QuestionSet - Container für mehrere Quiz-Fragen verschiedener Typen."""
     type: str = "H5P.QuestionSet"
     questions: list[H5PContentBase] = field(default_factory=list)
     intro_text: str = ""
+    # Gecachte Ausgabe von to_text() (Instanzen werden nach dem Parsen nicht verändert)
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -38,11 +42,7 @@ class QuestionSet(H5PContainer):
         if question_set and question_set.questions:
             # Speichere als dict (Dependency Inversion)
             # Alle Fragen werden als separate Texte gespeichert
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [q.to_text() for q in question_set.questions]
-            }
+            module.interactive_video = interactive_video_payload([q.to_text() for q in question_set.questions])
             return None
         
         return "Konnte QuestionSet nicht extrahieren oder keine Fragen gefunden"
@@ -61,19 +61,21 @@ class QuestionSet(H5PContainer):
         
         # Alle Fragen extrahieren
         extracted_questions = []
+        append = extracted_questions.append
+        extract = cls.extract_child_content
         
-        for question_data in params.get("questions", []):
-            q_library = question_data.get("library", "")
-            q_params = question_data.get("params", {})
+        for question_data in params.get("questions", ()):
+            q_library = question_data.get("library")
+            q_params = question_data.get("params")
             
             if not q_library or not q_params:
                 continue
             
             # Verwende bestehende Handler für jeden Fragetyp
-            extracted = QuestionSet.extract_child_content(q_library, q_params)
+            extracted = extract(q_library, q_params)
             
             if extracted:
-                extracted_questions.append(extracted)
+                append(extracted)
         
         if extracted_questions:
             return cls(
@@ -86,18 +88,20 @@ class QuestionSet(H5PContainer):
     
     def to_text(self) -> str:
         """Formatiert QuestionSet als Text mit allen Fragen."""
-        lines = []
+        if self._cached_text is not None:
+            return self._cached_text
         
         if self.intro_text:
-            lines.append(f"[QuestionSet] {self.intro_text}")
+            header = f"[QuestionSet] {self.intro_text}"
         else:
-            lines.append(f"[QuestionSet] {len(self.questions)} Fragen")
-        
-        lines.append("")
+            header = f"[QuestionSet] {len(self.questions)} Fragen"
         
-        for i, question in enumerate(self.questions, start=1):
-            lines.append(f"--- Frage {i} ---")
-            lines.append(question.to_text())
-            lines.append("")
+        # Header und Fragen als Blöcke, getrennt durch eine Leerzeile
+        blocks = [header]
+        blocks.extend(
+            f"--- Frage {i} ---\n{question.to_text()}"
+            for i, question in enumerate(self.questions, start=1)
+        )
         
-        return "\n".join(lines)
\ No newline at end of file
+        self._cached_text = "\n\n".join(blocks) + "\n"
+        return self._cached_text
\ No newline at end of file
@@ -1,16 +1,20 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from typing import Optional
-from src.loaders.models.hp5activities import strip_html, extract_library_from_h5p
-from src.loaders.models.h5pactivities.h5p_base import H5PLeaf
+from src.loaders.models.hp5activities import strip_html, strip_html_many, extract_library_from_h5p
+from src.loaders.models.h5pactivities.h5p_base import H5PLeaf, interactive_video_payload
 
 
-@dataclass
+@dataclass(slots=True)
 class QuizQuestion(H5PLeaf):
     """Quiz-Frage (Multiple/Single Choice) im Interactive Video."""
     type: str  # "H5P.MultiChoice" oder "H5P.SingleChoiceSet"
     question: str
     correct_answers: list[str]
     incorrect_answers: list[str] = field(default_factory=list)
+    # Gecachte Ausgabe von to_text() (Instanzen werden nach dem Parsen nicht verändert)
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -34,11 +38,7 @@ class QuizQuestion(H5PLeaf):
         
         if quiz:
             # Speichere als dict (Dependency Inversion)
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [quiz.to_text()]
-            }
+            module.interactive_video = interactive_video_payload([quiz.to_text()])
             return None
         
         return "Konnte Quiz-Frage nicht extrahieren"
@@ -96,18 +96,25 @@ class QuizQuestion(H5PLeaf):
         return None
     
     def to_text(self) -> str:
-        question_clean = strip_html(self.question)
-        correct_clean = [strip_html(a) for a in self.correct_answers]
-        incorrect_clean = [strip_html(a) for a in self.incorrect_answers]
-        return f"[Quiz] {question_clean}\nKorrekte Antwort(en): {', '.join(correct_clean)}\nInkorrekte Antwort(en): {', '.join(incorrect_clean)}"
+        if self._cached_text is None:
+            # Frage und alle Antworten in einem Durchlauf bereinigen
+            cleaned = strip_html_many([self.question, *self.correct_answers, *self.incorrect_answers])
+            incorrect_start = 1 + len(self.correct_answers)
+            question_clean = cleaned[0]
+            correct_clean = cleaned[1:incorrect_start]
+            incorrect_clean = cleaned[incorrect_start:]
+            self._cached_text = f"[Quiz] {question_clean}\nKorrekte Antwort(en): {', '.join(correct_clean)}\nInkorrekte Antwort(en): {', '.join(incorrect_clean)}"
+        return self._cached_text
 
 
-@dataclass
+@dataclass(slots=True)
 class TrueFalseQuestion(H5PLeaf):
     """Wahr/Falsch-Frage im Interactive Video."""
     type: str  # "H5P.TrueFalse"
     question: str
     correct_answer: bool
+    # Gecachte Ausgabe von to_text() (Instanzen werden nach dem Parsen nicht verändert)
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -122,11 +129,7 @@ class TrueFalseQuestion(H5PLeaf):
         
         if question:
             # Speichere als dict (Dependency Inversion)
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [question.to_text()]
-            }
+            module.interactive_video = interactive_video_payload([question.to_text()])
             return None
         
         return "Konnte True/False-Frage nicht extrahieren"
@@ -148,6 +151,8 @@ class TrueFalseQuestion(H5PLeaf):
         return None
     
     def to_text(self) -> str:
-        question_clean = strip_html(self.question)
-        answer = "Wahr" if self.correct_answer else "Falsch"
-        return f"[Wahr/Falsch] {question_clean}\nKorrekte Antwort: {answer}"
+        if self._cached_text is None:
+            question_clean = strip_html(self.question)
+            answer = "Wahr" if self.correct_answer else "Falsch"
+            self._cached_text = f"[Wahr/Falsch] {question_clean}\nKorrekte Antwort: {answer}"
+        return self._cached_text
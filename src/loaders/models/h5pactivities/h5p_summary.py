@@ -1,30 +1,37 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
-from src.loaders.models.hp5activities import strip_html
+from src.loaders.models.hp5activities import strip_html_many
 from src.loaders.models.h5pactivities.h5p_base import H5PLeaf
 
 
-@dataclass
+@dataclass(slots=True)
 class Summary(H5PLeaf):
     """Summary am Ende eines Interactive Videos."""
     type: str  # "H5P.Summary"
     intro: str
     statement_groups: list[list[str]]  # Jede Gruppe: [korrekte Aussage, falsche Aussagen...]
+    # Gecachte Ausgabe von to_text() (Instanzen werden nach dem Parsen nicht verändert)
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
-    @classmethod
-    def from_h5p_params(cls, library: str, params: dict) -> Optional['Summary']:
-        """Extrahiert Summary aus H5P params (aus Interaction)."""
-        intro = params.get("intro", "").strip()
-        summaries = params.get("summaries", [])
-        
+    @staticmethod
+    def _build_statement_groups(summaries) -> list[list[str]]:
+        """Bereinigte Aussagengruppen; erstes Statement ist korrekt, Rest sind falsch."""
         statement_groups = []
+        append = statement_groups.append
         for summary_group in summaries:
-            statements = summary_group.get("summary", [])
+            statements = summary_group.get("summary")
             if statements:
-                # Erstes Statement ist korrekt, Rest sind falsch
-                clean_statements = [s.strip() for s in statements if s.strip()]
+                # Jedes Statement nur einmal strippen, leere verwerfen
+                clean_statements = [t for t in (s.strip() for s in statements) if t]
                 if clean_statements:
-                    statement_groups.append(clean_statements)
+                    append(clean_statements)
+        return statement_groups
+    
+    @classmethod
+    def from_h5p_params(cls, library: str, params: dict) -> Optional['Summary']:
+        """Extrahiert Summary aus H5P params (aus Interaction)."""
+        intro = params.get("intro", "").strip()
+        statement_groups = cls._build_statement_groups(params.get("summaries", ()))
         
         # Nur Summary erstellen wenn tatsächlich Statements vorhanden sind
         if statement_groups:
@@ -44,16 +51,7 @@ class Summary(H5PLeaf):
         
         task_params = summary_data["task"].get("params", {})
         intro = task_params.get("intro", "").strip()
-        summaries = task_params.get("summaries", [])
-        
-        statement_groups = []
-        for summary_group in summaries:
-            statements = summary_group.get("summary", [])
-            if statements:
-                # Erstes Statement ist korrekt, Rest sind falsch
-                clean_statements = [s.strip() for s in statements if s.strip()]
-                if clean_statements:
-                    statement_groups.append(clean_statements)
+        statement_groups = cls._build_statement_groups(task_params.get("summaries", ()))
         
         # Nur Summary erstellen wenn tatsächlich Statements vorhanden sind
         if statement_groups:
@@ -82,17 +80,28 @@ class Summary(H5PLeaf):
         return "Summary konnte nicht extrahiert werden"
 
     def to_text(self) -> str:
-        intro_clean = strip_html(self.intro)
-        result = f"[Abschluss] {intro_clean}\n"
+        if self._cached_text is not None:
+            return self._cached_text
+        
+        # Intro und alle Aussagen in einem Durchlauf bereinigen
+        flat = [self.intro]
+        for statements in self.statement_groups:
+            flat.extend(statements)
+        cleaned = strip_html_many(flat)
+        
+        # Zeilen sammeln und einmal joinen statt wiederholtem String-+= (quadratisch)
+        parts = [f"[Abschluss] {cleaned[0]}"]
+        pos = 1
         
         for i, statements in enumerate(self.statement_groups, 1):
-            result += f"Aussagengruppe {i}:\n"
+            parts.append(f"Aussagengruppe {i}:")
             if statements:
-                correct = strip_html(statements[0])
-                result += f" Korrekt: {correct}\n"
-                if len(statements) > 1:
-                    incorrect = [strip_html(s) for s in statements[1:]]
-                    result += f" Falsch: {', '.join(incorrect)}\n"
-            result += "\n"
+                group_clean = cleaned[pos:pos + len(statements)]
+                pos += len(statements)
+                parts.append(f" Korrekt: {group_clean[0]}")
+                if len(group_clean) > 1:
+                    parts.append(f" Falsch: {', '.join(group_clean[1:])}")
+            parts.append("")
         
-        return result.strip()
\ No newline at end of file
+        self._cached_text = "\n".join(parts).strip()
+        return self._cached_text
\ No newline at end of file
@@ -2,22 +2,26 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from src.loaders.models.hp5activities import strip_html, extract_library_from_h5p
-from src.loaders.models.h5pactivities.h5p_base import H5PLeaf
+from src.loaders.models.h5pactivities.h5p_base import H5PLeaf, interactive_video_payload
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineEntry:
 	start_date: str
 	headline: str
 	text: str
+	# Gecachte Ausgabe von to_text()
+	_cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
 	def to_text(self) -> str:
-		headline_clean = strip_html(self.headline).strip()
-		text_clean = strip_html(self.text).strip()
-		return f"{self.start_date}: {headline_clean}\n{text_clean}" if text_clean else f"{self.start_date}: {headline_clean}"
+		if self._cached_text is None:
+			headline_clean = strip_html(self.headline)
+			text_clean = strip_html(self.text)
+			self._cached_text = f"{self.start_date}: {headline_clean}\n{text_clean}" if text_clean else f"{self.start_date}: {headline_clean}"
+		return self._cached_text
 
 
-@dataclass
+@dataclass(slots=True)
 class H5PTimeline(H5PLeaf):
 	"""Handler für H5P.Timeline."""
 	type: str
@@ -30,11 +34,7 @@ class H5PTimeline(H5PLeaf):
 
 		timeline = cls.from_h5p_params(library, params)
 		if timeline and timeline.entries:
-			module.interactive_video = {
-				"video_url": "",
-				"vimeo_id": None,
-				"interactions": [timeline.to_text()],
-			}
+			module.interactive_video = interactive_video_payload([timeline.to_text()])
 			return None
 
 		return "Konnte Timeline nicht extrahieren"
@@ -42,22 +42,21 @@ class H5PTimeline(H5PLeaf):
 	@classmethod
 	def from_h5p_params(cls, library: str, params: dict) -> Optional['H5PTimeline']:
 		timeline_data = params.get("timeline", {}) or params
-		entries_data = timeline_data.get("date", [])
+		entries_data = timeline_data.get("date", ())
 		entries: list[TimelineEntry] = []
+		append = entries.append
 
 		for item in entries_data:
-			start_date = item.get("startDate", "").strip()
-			headline = item.get("headline", "").strip()
-			text = item.get("text", "").strip()
+			item_get = item.get
+			start_date = item_get("startDate", "").strip()
+			headline = item_get("headline", "").strip()
+			text = item_get("text", "").strip()
 			if start_date or headline or text:
-				entries.append(TimelineEntry(start_date=start_date, headline=headline, text=text))
+				append(TimelineEntry(start_date=start_date, headline=headline, text=text))
 
 		if entries:
 			return cls(type=library, entries=entries)
 		return None
 
 	def to_text(self) -> str:
-		lines: list[str] = []
-		for entry in self.entries:
-			lines.append(entry.to_text())
-		return "\n\n".join(lines)
+		return "\n\n".join(entry.to_text() for entry in self.entries)
@@ -1,14 +1,75 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, ClassVar, Iterator, Optional
 from src.loaders.models.hp5activities import extract_library_from_h5p, strip_html
-from src.loaders.models.h5pactivities.h5p_base import H5PContainer, H5PContentBase
+from src.loaders.models.h5pactivities.h5p_base import (
+    H5PContainer,
+    H5PContentBase,
+    get_library_name,
+    interactive_video_payload,
+)
 from src.loaders.models.h5pactivities.h5p_basics import H5PVideo
 
 logger = logging.getLogger(__name__)
 
+def _clean_text(content_params: dict) -> str:
+    """Getrimmter "text"-Wert der params; strip() nur, wenn am Rand tatsächlich Whitespace steht."""
+    text = content_params.get("text")
+    if not text:
+        return ""
+    if text[0].isspace() or text[-1].isspace():
+        return text.strip()
+    return text
 
-@dataclass
+
+def _make_simple_text(content_library: str, content_params: dict) -> Optional['SimpleTextContent']:
+    """Übernimmt Text-Bibliotheken direkt als SimpleTextContent (None bei leerem Text)."""
+    text_content = _clean_text(content_params)
+    if text_content:
+        return SimpleTextContent(type=content_library, text=text_content)
+    return None
+
+
+# Bibliotheken, die ohne Registry direkt extrahiert werden (Machine-Name -> Extraktor)
+_DISPATCH: dict[str, Callable[[str, dict], Optional[H5PContentBase]]] = {
+    "H5P.AdvancedText": _make_simple_text,
+    "H5P.Text": _make_simple_text,
+}
+
+
+def _extract_child(content_library: str, content_params: dict, owner) -> Optional[H5PContentBase]:
+    """Extrahiert ein Kind-Element eines Wrappers: direkt über _DISPATCH, alle anderen Typen via Registry."""
+    extractor = _DISPATCH.get(get_library_name(content_library))
+    if extractor is not None:
+        return extractor(content_library, content_params)
+    return owner.extract_child_content(content_library, content_params)
+
+
+def _iter_extracted(items: list, owner, key: str) -> Iterator[tuple[dict, Optional[H5PContentBase]]]:
+    """
+    Liefert für jedes Item eines Wrappers (Item, extrahierter Inhalt).
+    
+    Der Inhalt liegt als {"library": ..., "params": ...} unter `key`. Fehlt die Library
+    oder sind die params leer, wird None geliefert; Items, die kein dict sind, werden übersprungen.
+    """
+    extract_child = _extract_child
+    # Nicht-dict-Items einmal vorab aussortieren (H5P liefert hier nur dicts aus JSON)
+    for item in [item for item in items if type(item) is dict]:
+        content_data = item.get(key)
+        if not content_data or not isinstance(content_data, dict):
+            yield item, None
+            continue
+        # Ohne Default-Werte: bei fehlenden Keys wird kein leeres dict/str angelegt
+        content_library = content_data.get("library")
+        content_params = content_data.get("params")
+        if not content_library or not content_params or not isinstance(content_params, dict):
+            yield item, None
+            continue
+        yield item, extract_child(content_library, content_params, owner)
+
+
+@dataclass(slots=True)
 class Column(H5PContainer):
     """
     H5P.Column - Extrem oberflächlicher Wrapper für mehrere H5P-Inhalte.
@@ -17,7 +78,12 @@ class Column(H5PContainer):
     Es können beliebige H5P-Typen in beliebiger Reihenfolge vorkommen.
     """
     type: str = "H5P.Column"
-    contents: list[H5PContentBase] = field(default_factory=list)
+    # Nach dem Extrahieren unveränderlich, daher Tupel statt Liste
+    contents: tuple[H5PContentBase, ...] = ()
+    # Eingebettete Videos aus contents, beim Extrahieren gesammelt (für Transkripte)
+    _videos: tuple[H5PVideo, ...] = field(default=(), init=False, repr=False, compare=False)
+    # Gecachte Ausgabe von to_text(); muss nach dem Setzen von Video-Transkripten zurückgesetzt werden
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -43,28 +109,43 @@ class Column(H5PContainer):
             vimeo_service = kwargs.get("vimeo_service")
             video_service = kwargs.get("video_service")
             if vimeo_service and video_service:
-                for c in column.contents:
-                    if isinstance(c, H5PVideo) and getattr(c, "video_url", None):
-                        try:
-                            video = video_service(id=0, vimeo_url=c.video_url)
-                            vimeo_id = video.video_id
-                            if vimeo_id:
-                                texttrack, _ = vimeo_service.get_transcript(vimeo_id)
-                                if texttrack and hasattr(texttrack, 'transcript'):
-                                    # Speichere Transkript direkt im H5PVideo-Objekt
+                # Mehrfach eingebettete Videos teilen sich einen Transkript-Abruf
+                videos_by_id: dict[str, list[H5PVideo]] = {}
+                for c in column._videos:
+                    if not c.video_url:
+                        continue
+                    video = video_service.try_from_url(c.video_url)
+                    if video is None:
+                        continue
+                    vimeo_id = video.video_id
+                    if vimeo_id:
+                        videos_by_id.setdefault(vimeo_id, []).append(c)
+
+                if videos_by_id:
+                    # Transkript-Abrufe sind reine Netzwerkanfragen und laufen daher parallel
+                    with ThreadPoolExecutor(max_workers=min(8, len(videos_by_id))) as executor:
+                        futures = {
+                            executor.submit(vimeo_service.get_transcript, vimeo_id): vimeo_id
+                            for vimeo_id in videos_by_id
+                        }
+                        for future in as_completed(futures):
+                            vimeo_id = futures[future]
+                            try:
+                                texttrack, _ = future.result()
+                            except Exception:
+                                continue
+                            if texttrack and hasattr(texttrack, 'transcript'):
+                                # Speichere Transkript direkt in den H5PVideo-Objekten
+                                for c in videos_by_id[vimeo_id]:
                                     c.transcript = texttrack.transcript
                                     c.vimeo_id = vimeo_id
-                        except Exception:
-                            pass
+                    # Videos haben sich geändert, ein zuvor gecachter Column-Text wäre veraltet
+                    column._cached_text = None
 
             # Speichere als dict (Dependency Inversion)
             # Alle Inhalte werden als separate Texte gespeichert
             # Accordion.to_text() gibt leeren String zurück, um Rauschen im RAG zu vermeiden
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [c.to_text() if hasattr(c, 'to_text') else str(c) for c in column.contents]
-            }
+            module.interactive_video = interactive_video_payload([c.to_text() for c in column.contents])
             return None
         
         return "Konnte Column nicht extrahieren oder keine Inhalte gefunden"
@@ -74,87 +155,68 @@ class Column(H5PContainer):
         """
         Extrahiert Column aus H5P params.
         
-        Iteriert durch alle content-Items und versucht, den passenden Handler
-        für jeden Inhaltstyp zu finden.
+        Jedes Item trägt den eigentlichen Inhalt nested unter "content".
         """
+        raw_items = params.get("content")
+        if not raw_items:
+            return None
+
         extracted_contents = []
-        
-        for item in params.get("content", []):
-            # Der eigentliche Inhalt ist nested in "content" Key
-            content_data = item.get("content", {})
-            
-            if not content_data:
-                continue
-            
-            content_library = content_data.get("library", "")
-            content_params = content_data.get("params", {})
-            
-            if not content_library or not content_params:
-                continue
-            
-            # Verwende bestehende Handler für jeden unterstützten Fragetyp
-            extracted = None
-            
-            # AdvancedText / Text - Special case für inline SimpleTextContent
-            if "H5P.AdvancedText" in content_library or "H5P.Text" in content_library:
-                # Einfachen Text extrahieren
-                text_content = content_params.get("text", "").strip()
-                if text_content:
-                    extracted = SimpleTextContent(
-                        type=content_library,
-                        text=text_content
-                    )
-            else:
-                # Alle anderen Typen via Registry
-                extracted = Column.extract_child_content(content_library, content_params)
-            
+        videos = []
+        append_content = extracted_contents.append
+        append_video = videos.append
+        for _, extracted in _iter_extracted(raw_items, cls, "content"):
             if extracted:
-                extracted_contents.append(extracted)
-        
+                append_content(extracted)
+                if isinstance(extracted, H5PVideo):
+                    append_video(extracted)
         if extracted_contents:
-            return cls(
-                type=library,
-                contents=extracted_contents
-            )
-        
+            column = cls(type=library, contents=tuple(extracted_contents))
+            column._videos = tuple(videos)
+            return column
         return None
     
-    def to_text(self) -> str:
-        """Formatiert Column als Text mit allen Inhalten."""
-        lines = []
-        lines.append(f"[Column] {len(self.contents)} Inhalte")
-        lines.append("")
-        
+    def _iter_lines(self) -> Iterator[str]:
+        """Liefert Kopfzeile und je nicht-leerem Inhalt "--- Inhalt i ---", Text und eine Leerzeile."""
+        yield f"[Column] {len(self.contents)} Inhalte"
+        yield ""
         for i, content in enumerate(self.contents, start=1):
-            text_output = content.to_text() if hasattr(content, 'to_text') else str(content)
+            text_output = content.to_text()
             # Überspringe leere Outputs (z.B. von Accordion)
             if text_output.strip():
-                lines.append(f"--- Inhalt {i} ---")
-                lines.append(text_output)
-                lines.append("")
-        
-        return "\n".join(lines)
+                yield f"--- Inhalt {i} ---"
+                yield text_output
+                yield ""
+    
+    def to_text(self) -> str:
+        """Formatiert Column als Text mit allen Inhalten."""
+        if self._cached_text is None:
+            self._cached_text = "\n".join(self._iter_lines())
+        return self._cached_text
 
 
-@dataclass
+@dataclass(slots=True)
 class SimpleTextContent:
     """Einfacher Text-Inhalt aus H5P.AdvancedText oder H5P.Text."""
     type: str
     text: str
+    # Gecachte Ausgabe von to_text()
+    _cached_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def to_text(self) -> str:
-        text_clean = strip_html(self.text)
-        return f"[Text] {text_clean}"
+        if self._cached_text is None:
+            self._cached_text = f"[Text] {strip_html(self.text)}"
+        return self._cached_text
 
 
-@dataclass
+@dataclass(slots=True)
 class AccordionPanel:
     """Ein Panel innerhalb eines H5P.Accordion."""
     title: str
     content: H5PContentBase  # Beliebiger H5P-Inhaltstyp
 
 
-@dataclass
+@dataclass(slots=True)
 class Accordion(H5PContainer):
     """
     H5P.Accordion - Accordion-ähnlicher Wrapper für mehrere H5P-Inhalte mit Titeln.
@@ -163,7 +225,11 @@ class Accordion(H5PContainer):
     Es können beliebige H5P-Typen in beliebiger Reihenfolge vorkommen.
     """
     type: str = "H5P.Accordion"
-    panels: list[AccordionPanel] = field(default_factory=list)
+    # Nach dem Extrahieren unveränderlich, daher Tupel statt Liste
+    panels: tuple[AccordionPanel, ...] = ()
+    is_accordion: ClassVar[bool] = True
+    # Gecachte Panel-Texte aus to_texts()
+    _cached_texts: Optional[tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -187,11 +253,7 @@ class Accordion(H5PContainer):
         if accordion and accordion.panels:
             # Speichere als dict (Dependency Inversion)
             # Alle Panels werden als separate Texte gespeichert
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [panel_text for panel_text in accordion.to_texts()]
-            }
+            module.interactive_video = interactive_video_payload(accordion.to_texts())
             return None
         
         return "Konnte Accordion nicht extrahieren oder keine Panels gefunden"
@@ -201,75 +263,47 @@ class Accordion(H5PContainer):
         """
         Extrahiert Accordion aus H5P params.
         
-        Iteriert durch alle panels und versucht, den passenden Handler
-        für jeden Panel-Inhaltstyp zu finden.
+        Jedes Panel hat einen Titel und den eigentlichen Inhalt unter "content".
         """
-        extracted_panels = []
-        
-        for panel_data in params.get("panels", []):
-            panel_title = panel_data.get("title", "Panel").strip()
-            content_data = panel_data.get("content", {})
-            
-            if not content_data:
-                continue
-            
-            content_library = content_data.get("library", "")
-            content_params = content_data.get("params", {})
-            
-            if not content_library or not content_params:
-                continue
-            
-            # Verwende bestehende Handler für jeden unterstützten Typ
-            extracted = None
-            
-            # AdvancedText / Text - Special case für inline SimpleTextContent
-            if "H5P.AdvancedText" in content_library or "H5P.Text" in content_library:
-                text_content = content_params.get("text", "").strip()
-                if text_content:
-                    extracted = SimpleTextContent(
-                        type=content_library,
-                        text=text_content
-                    )
-            else:
-                # Alle anderen Typen via Registry
-                extracted = Accordion.extract_child_content(content_library, content_params)
-            
-            if extracted:
-                extracted_panels.append(AccordionPanel(title=panel_title, content=extracted))
-        
+        raw_panels = params.get("panels")
+        if not raw_panels:
+            return None
+
+        extracted_panels = tuple(
+            AccordionPanel(title=panel_data.get("title", "Panel").strip(), content=extracted)
+            for panel_data, extracted in _iter_extracted(raw_panels, cls, "content")
+            if extracted
+        )
         if extracted_panels:
-            return cls(
-                type=library,
-                panels=extracted_panels
-            )
-        
+            return cls(type=library, panels=extracted_panels)
         return None
     
-    def to_texts(self) -> list[str]:
-        """Formatiert Accordion als Liste von Panel-Texten."""
+    def _iter_panel_texts(self) -> Iterator[str]:
+        """Liefert die formatierten Panel-Texte (gecacht nach dem ersten vollständigen Durchlauf)."""
+        if self._cached_texts is not None:
+            yield from self._cached_texts
+            return
         texts = []
-        
         for i, panel in enumerate(self.panels, start=1):
-            lines = []
-            lines.append(f"[Accordion Panel {i}] {panel.title}")
-            if hasattr(panel.content, 'to_text'):
-                lines.append(panel.content.to_text())
-            else:
-                lines.append(str(panel.content))
-            texts.append("\n".join(lines))
-        
-        return texts
+            text = f"[Accordion Panel {i}] {panel.title}\n{panel.content.to_text()}"
+            texts.append(text)
+            yield text
+        self._cached_texts = tuple(texts)
+    
+    def to_texts(self) -> list[str]:
+        """Formatiert Accordion als Liste von Panel-Texten."""
+        return list(self._iter_panel_texts())
     
     def to_text(self) -> str:
         """
         Formatiert Accordion-Inhalte ohne Headerzeile.
         Nur die Panel-Titel und deren Inhalte werden ausgegeben.
         """
-        return "\n".join(self.to_texts())
+        return "\n".join(self._iter_panel_texts())
 
 
 
-@dataclass
+@dataclass(slots=True)
 class GamemapStage:
     """Ein Stage/Element in einer Gamemap."""
     label: str
@@ -277,16 +311,12 @@ class GamemapStage:
 
     def to_text(self) -> str:
         """Formatiert den Stage mit Label und Inhalt."""
-        lines = []
-        lines.append(f"[Stage] {self.label}")
-        if self.content and hasattr(self.content, 'to_text'):
-            lines.append(self.content.to_text())
-        elif self.content:
-            lines.append(str(self.content))
-        return "\n".join(lines)
+        if not self.content:
+            return f"[Stage] {self.label}"
+        return f"[Stage] {self.label}\n{self.content.to_text()}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Gamemap(H5PContainer):
     """
     H5P.Gamemap - Interaktive Karte mit mehreren Stages/Elementen.
@@ -295,7 +325,8 @@ class Gamemap(H5PContainer):
     auf einer visuellen Karte anordnet. Jeder Stage hat einen Label und einen Content.
     """
     type: str = "H5P.Gamemap"
-    stages: list[GamemapStage] = field(default_factory=list)
+    # Nach dem Extrahieren unveränderlich, daher Tupel statt Liste
+    stages: tuple[GamemapStage, ...] = ()
     
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -308,11 +339,7 @@ class Gamemap(H5PContainer):
     
         if gamemap and gamemap.stages:
             # Speichere als dict (Dependency Inversion)
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [gamemap.to_text()],
-            }
+            module.interactive_video = interactive_video_payload([gamemap.to_text()])
             return None
     
         return "Konnte H5P.Gamemap nicht extrahieren"
@@ -323,58 +350,24 @@ class Gamemap(H5PContainer):
         Extrahiert H5P.Gamemap aus params.
     
         Verarbeitet die Struktur: params.gamemapSteps.gamemap.elements[]
+        Stages ohne extrahierbaren Inhalt werden nur mit ihrem Label übernommen.
         """
         try:
-            # Navigiere zur elements-Liste
-            gamemap_steps = params.get("gamemapSteps", {})
-            gamemap_data = gamemap_steps.get("gamemap", {})
-            elements = gamemap_data.get("elements", [])
-        
-            if not elements:
-                return None
-        
-            stages = []
-        
-            for element in elements:
-                if not isinstance(element, dict):
-                    continue
-            
-                # Extrahiere Label
-                label = element.get("label", "Unnamed Stage")
-            
-                # Extrahiere contentType
-                content_data = element.get("contentType", {})
-                content_library = content_data.get("library", "")
-                content_params = content_data.get("params", {})
-            
-                if not content_library or not content_params:
-                    # Fallback: nur Label ohne Content
-                    stages.append(GamemapStage(label=label, content=None))
-                    continue
-            
-                # Versuche den passenden Handler zu finden
-                extracted = None
-            
-                # AdvancedText / Text - Special case für inline SimpleTextContent
-                if "H5P.AdvancedText" in content_library or "H5P.Text" in content_library:
-                    text_content = content_params.get("text", "").strip()
-                    if text_content:
-                        extracted = SimpleTextContent(
-                            type=content_library,
-                            text=text_content
-                        )
-                else:
-                    # Alle anderen Typen via Registry
-                    extracted = Gamemap.extract_child_content(content_library, content_params)
-            
-                # Füge Stage hinzu (mit oder ohne extrahierten Content)
-                stages.append(GamemapStage(label=label, content=extracted))
-        
+            elements = params["gamemapSteps"]["gamemap"]["elements"]
+        except (KeyError, TypeError):
+            return None
+        if not elements:
+            return None
+
+        try:
+            stages = tuple(
+                GamemapStage(label=element.get("label", "Unnamed Stage"), content=extracted)
+                for element, extracted in _iter_extracted(elements, cls, "contentType")
+            )
             if stages:
                 return cls(type=library, stages=stages)
-    
         except Exception as e:
-            logger.debug(f"Fehler beim Parsen von Gamemap: {e}")
+            logger.debug("Fehler beim Parsen von Gamemap: %s", e)
     
         return None
 
@@ -383,30 +376,30 @@ class Gamemap(H5PContainer):
         if not self.stages:
             return "[Gamemap] Keine Stages vorhanden"
     
-        stage_texts = [stage.to_text() for stage in self.stages]
-        return "\n\n".join(stage_texts)
+        return "\n\n".join(stage.to_text() for stage in self.stages)
 
 
-@dataclass
+@dataclass(slots=True)
 class CourseSlide:
     """Eine einzelne Slide innerhalb von H5P.CoursePresentation."""
     index: int
-    contents: list[H5PContentBase] = field(default_factory=list)
+    contents: tuple[H5PContentBase, ...] = ()
 
-    def to_text(self) -> str:
-        lines = []
-        lines.append(f"[Seite {self.index}]:")
+    def _write_into(self, buf: list[str]) -> None:
+        """Hängt die Zeilen der Slide an einen gemeinsamen Ausgabepuffer an."""
+        buf.append(f"[Seite {self.index}]:")
         for content in self.contents:
-            if hasattr(content, 'to_text'):
-                text_output = content.to_text()
-            else:
-                text_output = str(content)
+            text_output = content.to_text()
             if text_output.strip():
-                lines.append(text_output)
-        return "\n".join(lines)
+                buf.append(text_output)
+
+    def to_text(self) -> str:
+        buf: list[str] = []
+        self._write_into(buf)
+        return "\n".join(buf)
 
 
-@dataclass
+@dataclass(slots=True)
 class CoursePresentation(H5PContainer):
     """
     H5P.CoursePresentation – Wrapper für Slides mit diversen H5P-Elementen.
@@ -416,7 +409,7 @@ class CoursePresentation(H5PContainer):
     und geben sie je Slide mit Präfix "[Seite N]:" aus.
     """
     type: str = "H5P.CoursePresentation"
-    slides: list[CourseSlide] = field(default_factory=list)
+    slides: tuple[CourseSlide, ...] = ()
 
     @classmethod
     def from_h5p_package(cls, module, content: dict, h5p_zip_path: str, **kwargs) -> Optional[str]:
@@ -428,54 +421,39 @@ class CoursePresentation(H5PContainer):
         cp = cls.from_h5p_params(library, content)
 
         if cp and cp.slides:
-            module.interactive_video = {
-                "video_url": "",
-                "vimeo_id": None,
-                "interactions": [slide.to_text() for slide in cp.slides],
-            }
+            module.interactive_video = interactive_video_payload([slide.to_text() for slide in cp.slides])
             return None
 
         return "Konnte H5P.CoursePresentation nicht extrahieren oder keine Slides gefunden"
 
     @classmethod
     def from_h5p_params(cls, library: str, params: dict) -> Optional['CoursePresentation']:
-        """Extrahiert Slides und deren Elemente aus den H5P params."""
-        presentation = params.get("presentation", {})
-        raw_slides = presentation.get("slides", [])
+        """Extrahiert Slides und deren Elemente (unter "action") aus den H5P params."""
+        try:
+            raw_slides = params["presentation"]["slides"]
+        except (KeyError, TypeError):
+            return None
         if not raw_slides:
             return None
 
-        slides: list[CourseSlide] = []
-
+        slides = []
+        append_slide = slides.append
         for idx, slide in enumerate(raw_slides, start=1):
-            contents: list[Any] = []
-            for element in slide.get("elements", []):
-                action = element.get("action", {})
-                content_library = action.get("library", "")
-                content_params = action.get("params", {})
-
-                if not content_library or not isinstance(content_params, dict):
-                    continue
-
-                extracted = None
-
-                # AdvancedText / Text - Special case für inline SimpleTextContent
-                if "H5P.AdvancedText" in content_library or "H5P.Text" in content_library:
-                    text_content = content_params.get("text", "").strip()
-                    if text_content:
-                        extracted = SimpleTextContent(type=content_library, text=text_content)
-                else:
-                    # Alle anderen Typen via Registry
-                    extracted = CoursePresentation.extract_child_content(content_library, content_params)
-
+            contents = []
+            append_content = contents.append
+            for _, extracted in _iter_extracted(slide.get("elements") or (), cls, "action"):
                 if extracted:
-                    contents.append(extracted)
-
-            slides.append(CourseSlide(index=idx, contents=contents))
-
-        return cls(type=library, slides=slides) if slides else None
+                    append_content(extracted)
+            append_slide(CourseSlide(index=idx, contents=tuple(contents)))
+        return cls(type=library, slides=tuple(slides)) if slides else None
 
     def to_text(self) -> str:
         if not self.slides:
             return "[CoursePresentation] Keine Slides vorhanden"
-        return "\n\n".join(slide.to_text() for slide in self.slides)
+        # Alle Slides in einen Puffer schreiben (Leerzeile als Trenner) statt je Slide einen String zu bauen
+        buf: list[str] = []
+        for slide in self.slides:
+            if buf:
+                buf.append("")
+            slide._write_into(buf)
+        return "\n".join(buf)
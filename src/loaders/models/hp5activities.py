@@ -2,6 +2,7 @@ from pathlib import Path
 import re
 import json
 import zipfile
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import BaseModel, HttpUrl, root_validator
@@ -17,29 +18,111 @@ def extract_library_from_h5p(h5p_zip_path: str) -> Optional[str]:
 		Library-Name (z.B. "H5P.Flashcards") oder None bei Fehler
 	"""
 	try:
+		# Nur der h5p.json-Eintrag wird dekomprimiert, der Rest des Archivs bleibt unberührt
 		with zipfile.ZipFile(h5p_zip_path, "r") as zip_ref:
-			with zip_ref.open("h5p.json") as f:
-				h5p_data = json.load(f)
-				return h5p_data.get("mainLibrary", "")
+			h5p_data = json.loads(zip_ref.read("h5p.json"))
+		return h5p_data.get("mainLibrary", "")
 	except Exception:
 		return None
 
 
+def read_h5p_file(h5p_zip_path: str, name: str, h5p_zip: Optional[zipfile.ZipFile] = None) -> Optional[bytes]:
+    """Liest eine Datei aus dem H5P-Package, None falls sie im Archiv nicht existiert.
+    
+    Ist bereits ein geöffnetes ZipFile vorhanden, wird dieses verwendet, damit das
+    Zentralverzeichnis des Archivs nicht erneut eingelesen werden muss.
+    """
+    if h5p_zip is not None:
+        return _read_zip_member(h5p_zip, name)
+    with zipfile.ZipFile(h5p_zip_path, "r") as zip_ref:
+        return _read_zip_member(zip_ref, name)
+
+
+def _read_zip_member(zip_ref: zipfile.ZipFile, name: str) -> Optional[bytes]:
+    # Prüfung im Namensverzeichnis statt KeyError bei fehlender Datei (häufiger Fall)
+    if name not in zip_ref.NameToInfo:
+        return None
+    return zip_ref.read(name)
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+
+# In H5P-Inhalten übliche HTML-Entities
+_ENTITIES = {
+    '&nbsp;': ' ',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&amp;': '&',
+    '&quot;': '"',
+}
+_ENTITY_RE = re.compile(r'&(?:nbsp|lt|gt|amp|quot);')
+# Tags und Entities in einem Durchlauf; Tags sind nicht in _ENTITIES und fallen damit weg.
+# Da jede Stelle nur einmal ersetzt wird, wird z.B. "&amp;lt;" zu "&lt;" und nicht zu "<".
+_TAG_OR_ENTITY_RE = re.compile(r'<[^>]+>|&(?:nbsp|lt|gt|amp|quot);')
+
+
+def _replace_markup(match: re.Match) -> str:
+    return _ENTITIES.get(match.group(0), '')
+
+
+def _decode_entities(text: str) -> str:
+    """Ersetzt die in H5P-Inhalten üblichen HTML-Entities."""
+    return _ENTITY_RE.sub(_replace_markup, text)
+
+
+# Längere Texte (z.B. ganze Transkripte oder Buchkapitel) wiederholen sich kaum und werden nicht gecacht
+_STRIP_HTML_CACHE_MAX_LEN = 512
+
+
 def strip_html(text: str) -> str:
-    """Entfernt HTML-Tags und dekodiert HTML-Entities."""
+    """Entfernt HTML-Tags und dekodiert HTML-Entities (kurze Strings werden gecacht)."""
     if not text:
         return ""
-    # Entferne HTML-Tags
-    text = re.sub(r'<[^>]+>', '', text)
-    # Ersetze HTML-Entities
-    text = text.replace('&nbsp;', ' ')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&quot;', '"')
-    # Entferne übermäßige Whitespaces
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    if len(text) > _STRIP_HTML_CACHE_MAX_LEN:
+        return _strip_html_uncached(text)
+    return _strip_html_cached(text)
+
+
+def _strip_html_uncached(text: str) -> str:
+    has_tag = '<' in text
+    has_entity = '&' in text
+    if has_tag and has_entity:
+        # Tags entfernen und Entities dekodieren in einem einzigen Regex-Durchlauf
+        text = _TAG_OR_ENTITY_RE.sub(_replace_markup, text)
+    elif has_tag:
+        # Nur Tags: Ersetzung durch '' ohne Python-Callback pro Treffer
+        text = _TAG_RE.sub('', text)
+    elif has_entity:
+        text = _decode_entities(text)
+    # Entferne übermäßige Whitespaces; isprintable() schließt alle Whitespaces außer ' ' aus,
+    # ohne doppelte Leerzeichen gibt es dann nichts zusammenzufassen
+    if text.isprintable() and '  ' not in text:
+        return text.strip()
+    return _WS_RE.sub(' ', text).strip()
+
+
+_strip_html_cached = lru_cache(maxsize=8192)(_strip_html_uncached)
+
+
+# Trennzeichen für strip_html_many: wird weder von \s noch (dank [^>\x00])
+# von der Tag-Regex erfasst, daher bleiben die Grenzen zwischen den Strings erhalten.
+_BATCH_SEP = "\x00"
+_BATCH_TAG_OR_ENTITY_RE = re.compile(r'<[^>\x00]+>|&(?:nbsp|lt|gt|amp|quot);')
+
+
+def strip_html_many(texts: list[str]) -> list[str]:
+    """Wie strip_html, aber für viele Strings in einem einzigen Regex-Durchlauf."""
+    # Bei sehr wenigen Strings lohnt sich das Zusammenfügen nicht
+    if len(texts) <= 2:
+        return [strip_html(text) for text in texts]
+    if any(_BATCH_SEP in text for text in texts if text):
+        return [strip_html(text) for text in texts]
+    joined = _BATCH_SEP.join(text or "" for text in texts)
+    joined = _BATCH_TAG_OR_ENTITY_RE.sub(_replace_markup, joined)
+    joined = _WS_RE.sub(' ', joined)
+    return [part.strip() for part in joined.split(_BATCH_SEP)]
 
 
 class H5PActivities(BaseModel):
@@ -51,6 +134,7 @@ class H5PActivities(BaseModel):
 
     @root_validator(pre=True)
     def validate_fileurl(cls, values):
-        values["fileurl"] = values["package"][0]["fileurl"]
-        values["filename"] = values["package"][0]["filename"]
+        package = values["package"][0]
+        values["fileurl"] = package["fileurl"]
+        values["filename"] = package["filename"]
         return values
\ No newline at end of file
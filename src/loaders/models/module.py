@@ -1,4 +1,5 @@
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any, Optional
 
 from llama_index.core import Document
@@ -14,6 +15,41 @@ from src.loaders.models.url import UrlModule
 from src.loaders.models.videotime import Video
 
 
+# Abschnittsüberschrift je H5P-Typ (Teilstring des Library-Namens). Die Reihenfolge ist relevant:
+# der erste Treffer gewinnt, z.B. "DragText" vor "Text" und "InteractiveVideo" vor "Video".
+_H5P_HEADERS: tuple[tuple[str, str], ...] = (
+    ("InteractiveVideo", "\n--- Interaktive Inhalte im Video ---"),
+    ("Accordion", "\n--- Accordion-Inhalte ---"),
+    ("Column", "\n--- Spalten-Inhalte ---"),
+    ("QuestionSet", "\n--- Fragen im QuestionSet ---"),
+    ("CoursePresentation", "\n--- Course Presentation ---"),
+    ("MultiChoice", "\n--- Quiz-Frage ---"),
+    ("SingleChoiceSet", "\n--- Quiz-Frage ---"),
+    ("TrueFalse", "\n--- Wahr/Falsch-Frage ---"),
+    ("Blanks", "\n--- Lückentext ---"),
+    ("DragText", "\n--- Drag-Text-Aufgabe ---"),
+    ("DragQuestion", "\n--- Drag-&-Drop-Aufgabe ---"),
+    ("Text", "\n--- H5P Text-Inhalt ---"),
+    ("Video", "\n--- Video-Inhalt ---"),
+    ("Dialogcards", "\n--- Dialog-Karten ---"),
+    ("Flashcards", "\n--- Karteikarten ---"),
+    ("ImageHotspot", "\n--- Bild-Hotspot-Aufgabe ---"),
+    ("Timeline", "\n--- Timeline ---"),
+    ("Gamemap", "\n--- Interaktive Karte (Gamemap) ---"),
+    ("GameMap", "\n--- Interaktive Karte (Gamemap) ---"),
+    ("Crossword", "\n--- Kreuzworträtsel ---"),
+)
+
+
+@lru_cache(maxsize=256)
+def _h5p_header(h5p_content_type: str) -> str:
+    """Überschrift für die H5P-Inhalte eines Moduls (pro Library-Name gecacht)."""
+    for pattern, header in _H5P_HEADERS:
+        if pattern in h5p_content_type:
+            return header
+    return f"\n--- H5P Inhalt ({h5p_content_type}) ---"
+
+
 class ModuleTypes(StrEnum):
     VIDEOTIME = "videotime"
     PAGE = "page"
@@ -25,6 +61,10 @@ class ModuleTypes(StrEnum):
     URL = "url"
 
 
+# Moodle-modname -> ModuleTypes; andere modnames haben keinen Typ
+_MODNAME_TO_TYPE: dict[str, ModuleTypes] = {module_type.value: module_type for module_type in ModuleTypes}
+
+
 class Module(BaseModel):
     """Lowest level content block of a course. Can be a file, video, hp5, etc."""
 
@@ -53,25 +93,7 @@ class Module(BaseModel):
     @computed_field  # type: ignore[misc]
     @property
     def type(self) -> Optional[ModuleTypes]:
-        match self.modname:
-            case "videotime":
-                return ModuleTypes.VIDEOTIME
-            case "page":
-                return ModuleTypes.PAGE
-            case "h5pactivity":
-                return ModuleTypes.H5P
-            case "glossary":
-                return ModuleTypes.GLOSSARY
-            case "resource":
-                return ModuleTypes.RESOURCE
-            case "folder":
-                return ModuleTypes.FOLDER
-            case "book":
-                return ModuleTypes.BOOK
-            case "url":
-                return ModuleTypes.URL
-            case _:
-                return None
+        return _MODNAME_TO_TYPE.get(self.modname)
 
     def to_document(self, course_id) -> Document:
         text_parts = []
@@ -93,57 +115,16 @@ class Module(BaseModel):
         # Transkript
         if len(self.transcripts) > 0:
             text_parts.append("\nTranscript:")
-            text_parts.extend([str(transcript) for transcript in self.transcripts])
+            text_parts.extend(map(str, self.transcripts))
         
         # H5P Inhalte (Interactive Video, QuestionSet, etc.)
         if self.interactive_video:
             # Dynamischer Header basierend auf H5P-Typ
-            if self.h5p_content_type:
-                if "InteractiveVideo" in self.h5p_content_type:
-                    header = "\n--- Interaktive Inhalte im Video ---"
-                elif "Accordion" in self.h5p_content_type:
-                    header = "\n--- Accordion-Inhalte ---"
-                elif "Column" in self.h5p_content_type:
-                    header = "\n--- Spalten-Inhalte ---"
-                elif "QuestionSet" in self.h5p_content_type:
-                    header = "\n--- Fragen im QuestionSet ---"
-                elif "CoursePresentation" in self.h5p_content_type:
-                    header = "\n--- Course Presentation ---"
-                elif "MultiChoice" in self.h5p_content_type or "SingleChoiceSet" in self.h5p_content_type:
-                    header = "\n--- Quiz-Frage ---"
-                elif "TrueFalse" in self.h5p_content_type:
-                    header = "\n--- Wahr/Falsch-Frage ---"
-                elif "Blanks" in self.h5p_content_type:
-                    header = "\n--- Lückentext ---"
-                elif "DragText" in self.h5p_content_type:
-                    header = "\n--- Drag-Text-Aufgabe ---"
-                elif "DragQuestion" in self.h5p_content_type:
-                    header = "\n--- Drag-&-Drop-Aufgabe ---"
-                elif "Text" in self.h5p_content_type:
-                    header = "\n--- H5P Text-Inhalt ---"
-                elif "Video" in self.h5p_content_type:
-                    header = "\n--- Video-Inhalt ---"
-                elif "Dialogcards" in self.h5p_content_type:
-                    header = "\n--- Dialog-Karten ---"
-                elif "Flashcards" in self.h5p_content_type:
-                    header = "\n--- Karteikarten ---"
-                elif "ImageHotspot" in self.h5p_content_type:
-                    header = "\n--- Bild-Hotspot-Aufgabe ---"
-                elif "Timeline" in self.h5p_content_type:
-                    header = "\n--- Timeline ---"
-                elif "Gamemap" in self.h5p_content_type or "GameMap" in self.h5p_content_type:
-                    header = "\n--- Interaktive Karte (Gamemap) ---"
-                elif "Crossword" in self.h5p_content_type:
-                    header = "\n--- Kreuzworträtsel ---"
-                else:
-                    header = f"\n--- H5P Inhalt ({self.h5p_content_type}) ---"
-            else:
-                header = "\n--- H5P Inhalte ---"
+            header = _h5p_header(self.h5p_content_type) if self.h5p_content_type else "\n--- H5P Inhalte ---"
             
             text_parts.append(header)
-            interactions = self.interactive_video.get("interactions", [])
-            for interaction_text in interactions:
-                text_parts.append(interaction_text)
+            # Interaktionen liegen bereits als fertige Strings vor
+            text_parts.extend(self.interactive_video.get("interactions", ()))
         
         # Glossary Einträge
         if self.glossary and self.glossary.total_entries > 0:
@@ -44,6 +44,15 @@ class Video(BaseModel):
             logger.exception(f"An error occurred trying to validate video {self.video_url}: {e}")
             return self
 
+    @classmethod
+    def try_from_url(cls, url: str) -> Union["Video", None]:
+        """Build a Video from a URL, or return None if the URL cannot be validated."""
+        try:
+            return cls(id=0, vimeo_url=url)
+        except (ValidationError, ValueError, TypeError):
+            # validate_video_url raises TypeError for redirect links without a url parameter (HttpUrl(None))
+            return None
+
     @computed_field  # type: ignore[misc]
     @property
     def type(self) -> VideoPlatforms:
@@ -64,7 +73,11 @@ class Video(BaseModel):
         match self.type:
             case VideoPlatforms.VIMEO:
                 vimeo_video_id_pattern = r"\d+"
-                return re.findall(vimeo_video_id_pattern, str(self.video_url.path))[0]
+                matches = re.findall(vimeo_video_id_pattern, str(self.video_url.path))
+                if matches:
+                    return matches[0]
+                else:
+                    return None
             case VideoPlatforms.YOUTUBE:
                 youtube_video_id_pattern = (
                     r"(?:youtube\.com\/(?:[^\/]+\/.+\/|(?:v|e(?:mbed)?)\/|.*[?&]v=)|youtu\.be\/)([^\"&?\/\s]{11})"
@@ -28,7 +28,7 @@ from src.loaders.models.folder import Folder
 from src.loaders.models.glossary import Glossary, GlossaryEntry
 from src.loaders.models.hp5activities import H5PActivities
 from src.loaders.models.module import ModuleTypes
-from src.loaders.models.h5pactivities.h5p_base import get_handler_for_library, initialize_registry
+from src.loaders.models.h5pactivities.h5p_base import get_handler_for_library
 from src.loaders.models.moodlecourse import MoodleCourse
 from src.loaders.models.resource import Resource
 from src.loaders.models.url import UrlModule
@@ -509,51 +509,42 @@ class Moodle:
             # H5P-Package herunterladen
             local_filename = h5pfile_call.getFile(activity.filename, tmp_dir)
             
-            # h5p.json für library-Feld extrahieren
+            # Archiv einmal öffnen und für alle Zugriffe (JSON, VTT-Fallback) offen halten
             with zipfile.ZipFile(local_filename, "r") as zip_ref:
-                zip_ref.extract("h5p.json", tmp_dir)
-                zip_ref.extract("content/content.json", tmp_dir)
-            
-            # Lade h5p.json für library-Informationen
-            h5p_json = f"{tmp_dir}/h5p.json"
-            with open(h5p_json, "r") as json_file:
-                h5p_data = json.load(json_file)
-            
-            # Lade content.json für eigentliche Inhalte
-            content_json = f"{tmp_dir}/content/content.json"
-            with open(content_json, "r") as json_file:
-                content = json.load(json_file)
-            
-            # H5P Content-Typ aus h5p.json extrahieren (nicht content.json!)
-            library = h5p_data.get("mainLibrary", "") or h5p_data.get("preloadedDependencies", [{}])[0].get("machineName", "")
-            if not library:
-                self.logger.error(f"Kein library-Feld in h5p.json für Modul {module.id}")
-                return "Kein library-Feld in h5p.json gefunden"
-            
-            module.h5p_content_type = library
-            self.logger.info(f"Verarbeite H5P-Typ: {library} für Modul {module.id}")
-            
-            # Initialisiere Registry beim ersten Aufruf
-            initialize_registry()
-            
-            # Finde passenden Handler via Registry
-            handler_class = get_handler_for_library(library)
-            
-            if not handler_class:
-                self.logger.warning(f"H5P-Typ '{library}' wird noch nicht unterstützt (Modul {module.id})")
-                return f"H5P-Typ '{library}' wird noch nicht unterstützt"
-            
-            self.logger.info(f"Rufe Handler {handler_class.__name__} auf für Modul {module.id}")
-            
-            # Rufe from_h5p_package direkt auf (befüllt module und gibt error zurück)
-            err = handler_class.from_h5p_package(
-                module=module,
-                content=content,
-                h5p_zip_path=local_filename,
-                vimeo_service=Vimeo(),
-                video_service=Video
-            )
-            
+                # Lade h5p.json für library-Informationen (direkt aus dem Archiv, ohne Entpacken)
+                h5p_data = json.loads(zip_ref.read("h5p.json"))
+                
+                # Lade content.json für eigentliche Inhalte (Handler erhalten das fertige dict)
+                content = json.loads(zip_ref.read("content/content.json"))
+                
+                # H5P Content-Typ aus h5p.json extrahieren (nicht content.json!)
+                library = h5p_data.get("mainLibrary", "") or h5p_data.get("preloadedDependencies", [{}])[0].get("machineName", "")
+                if not library:
+                    self.logger.error(f"Kein library-Feld in h5p.json für Modul {module.id}")
+                    return "Kein library-Feld in h5p.json gefunden"
+                
+                module.h5p_content_type = library
+                self.logger.info(f"Verarbeite H5P-Typ: {library} für Modul {module.id}")
+                
+                # Finde passenden Handler via Registry (wird beim ersten Zugriff einmalig initialisiert)
+                handler_class = get_handler_for_library(library)
+                
+                if not handler_class:
+                    self.logger.warning(f"H5P-Typ '{library}' wird noch nicht unterstützt (Modul {module.id})")
+                    return f"H5P-Typ '{library}' wird noch nicht unterstützt"
+                
+                self.logger.info(f"Rufe Handler {handler_class.__name__} auf für Modul {module.id}")
+                
+                # Rufe from_h5p_package direkt auf (befüllt module und gibt error zurück)
+                err = handler_class.from_h5p_package(
+                    module=module,
+                    content=content,
+                    h5p_zip_path=local_filename,
+                    h5p_zip=zip_ref,
+                    vimeo_service=Vimeo(),
+                    video_service=Video
+                )
+                
             if err:
                 self.logger.error(f"Fehler beim Verarbeiten von Modul {module.id}: {err}")
             else:
@@ -0,0 +1,91 @@
+"""Tests für strip_html / strip_html_many (HTML-Bereinigung der H5P-Texte)."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.loaders.models import hp5activities
+from src.loaders.models.hp5activities import strip_html, strip_html_many
+
+
+examples = [
+    # Verschachtelte Tags
+    ("<div><p>Hallo <b>Welt</b></p></div>", "Hallo Welt"),
+    ("<ul><li><p>Eins</p></li><li><p>Zwei</p></li></ul>", "EinsZwei"),
+    ("<p>Was ist <b>KI</b>?</p>", "Was ist KI?"),
+    # Einfache Entities, mit und ohne Tags
+    ("Kaffee &amp; Kuchen", "Kaffee & Kuchen"),
+    ("<p>Absatz &quot;Zitat&quot;</p>", 'Absatz "Zitat"'),
+    ("<div>Künstliche&nbsp;Intelligenz</div>", "Künstliche Intelligenz"),
+    # Dekodierte Tags bleiben als Text erhalten
+    ("&lt;b&gt;fett&lt;/b&gt;", "<b>fett</b>"),
+    ("<p>Die Erde ist &lt;rund&gt;</p>", "Die Erde ist <rund>"),
+    # Doppelt maskierte Entities werden nur einmal dekodiert
+    ("&amp;lt;", "&lt;"),
+    ("&amp;quot;", "&quot;"),
+    ("&amp;amp;", "&amp;"),
+    ("<p>&amp;quot;</p>", "&quot;"),
+    ("<p>&amp;nbsp;x</p>", "&nbsp;x"),
+    # Durch einen Tag getrennte Entity wird nicht wieder zusammengesetzt
+    ("&</p>amp;", "&amp;"),
+    # Unbekannte Entities bleiben unverändert
+    ("&euro; 5", "&euro; 5"),
+    # Whitespace wird zusammengefasst und getrimmt
+    ("<p>Hallo   Welt\n</p>", "Hallo Welt"),
+    ("  a <b> c  ", "a c"),
+    ("a &nbsp; b", "a b"),
+    ("", ""),
+    (None, ""),
+]
+
+
+@pytest.mark.parametrize("text, expected", examples)
+def test_strip_html(text, expected):
+    assert strip_html(text) == expected
+
+
+@pytest.mark.parametrize("texts", [
+    [text for text, _ in examples],
+    ["<p>A</p>", "", "B &amp; C", None, "<b>x</b>\n\ny"],
+    ["a", "b"],
+    [],
+])
+def test_strip_html_many_matches_strip_html(texts):
+    assert strip_html_many(texts) == [strip_html(text) for text in texts]
+
+
+def test_strip_html_many_keeps_boundaries_with_separator_char():
+    # Enthält ein Eingabestring das interne Trennzeichen, darf die Aufteilung nicht verrutschen
+    texts = ["<p>a\x00b</p>", "c", "<i>d</i>"]
+    result = strip_html_many(texts)
+    assert len(result) == len(texts)
+    assert result == [strip_html(text) for text in texts]
+
+
+def test_strip_html_many_tag_does_not_span_strings():
+    # Ein offenes "<" darf keinen Tag über die Stringgrenze hinweg bilden
+    texts = ["a < b", "c > d", "e"]
+    assert strip_html_many(texts) == ["a < b", "c > d", "e"]
+
+
+def test_strip_html_long_input_bypasses_cache():
+    chunk = "<p>Satz&nbsp;mit &amp; Entity</p>\n"
+    long_text = chunk * 40
+    assert len(long_text) > hp5activities._STRIP_HTML_CACHE_MAX_LEN
+
+    hp5activities._strip_html_cached.cache_clear()
+    result = strip_html(long_text)
+
+    assert result == " ".join(["Satz mit & Entity"] * 40)
+    assert hp5activities._strip_html_cached.cache_info().currsize == 0
+
+
+def test_strip_html_long_input_matches_short_chunks():
+    chunks = [f"<li>Punkt {i} &lt;{i}&gt; &amp;amp;</li>" for i in range(60)]
+    long_text = "".join(chunks)
+    assert len(long_text) > hp5activities._STRIP_HTML_CACHE_MAX_LEN
+    assert strip_html(long_text) == "".join(strip_html(chunk) for chunk in chunks)